@@ -21,19 +21,35 @@ from typing import Optional, Dict, Any
 from PIL import Image as PILImage
 import qrcode
 from io import BytesIO
-import base64
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from collections import Counter
+from operator import attrgetter
 import json
 import uuid
+from jinja2 import Environment
 
-from database import SessionLocal, Material, Property, Image, MaterialMetadata, ReferenceURL, UseExample, ProcessExampleImage, MaterialSubmission, init_db
+# Base64エンコーダ（pybase64が無い環境の代替は utils.image_display 側で1か所にまとめている）
+from utils.image_display import b64encode
+
+try:
+    import orjson
+
+    def _json_dumps(value) -> str:
+        """JSON文字列化（orjsonはUTF-8のまま出力するため ensure_ascii=False 相当）"""
+        return orjson.dumps(value).decode()
+except ImportError:
+    # orjsonが無い環境では標準ライブラリで代替
+    def _json_dumps(value) -> str:
+        """JSON文字列化（日本語はエスケープしない）"""
+        return json.dumps(value, ensure_ascii=False)
+
+from database import SessionLocal, Material, Property, Image, MaterialMetadata, ReferenceURL, UseExample, ProcessExampleImage, MaterialSubmission, init_db, search_material_ids
 from material_form_detailed import _normalize_required
 from sqlalchemy.orm import selectinload
-from sqlalchemy import select, func
+from sqlalchemy import select, func, lambda_stmt, bindparam, update, insert
 from utils.logo import render_site_header, render_logo_mark, show_logo_debug_info, get_logo_debug_info, get_project_root
 
 # card_generatorとschemasのimportは削除（起動時クラッシュを避けるため）
@@ -133,20 +149,7 @@ def get_image_path(filename):
             return str(path)
     return None
 
-def get_base64_image(image_path):
-    """画像をBase64エンコード"""
-    if image_path and os.path.exists(image_path):
-        try:
-            with open(image_path, "rb") as img_file:
-                return base64.b64encode(img_file.read()).decode()
-        except Exception as e:
-            print(f"画像読み込みエラー: {e}")
-            return None
-    return None
-
-# 背景画像の読み込み（メイン.webpのみ）
-main_bg_path = get_image_path("メイン.webp")
-main_bg_base64 = get_base64_image(main_bg_path) if main_bg_path else None
+# 背景画像はCSSに埋め込まない（白背景のWOTA風デザイン。ヒーロー画像はファイルから直接表示する）
 
 # アイコンファイルの読み込み（iconmonstr風のシンプルなSVGアイコン）
 def get_icon_path(icon_name: str) -> Optional[str]:
@@ -162,7 +165,7 @@ def get_icon_base64(icon_name: str) -> Optional[str]:
     if icon_path:
         try:
             with open(icon_path, "rb") as f:
-                return base64.b64encode(f.read()).decode()
+                return b64encode(f.read()).decode()
         except Exception:
             return None
     return None
@@ -178,7 +181,7 @@ def get_icon_svg_inline(icon_name: str, size: int = 48, color: str = "#999999")
                 svg_content = svg_content.replace('stroke="#999999"', f'stroke="{color}"')
                 svg_content = svg_content.replace('width="48"', f'width="{size}"')
                 svg_content = svg_content.replace('height="48"', f'height="{size}"')
-                return base64.b64encode(svg_content.encode()).decode()
+                return b64encode(svg_content.encode()).decode()
         except Exception:
             pass
     return ""
@@ -188,12 +191,11 @@ def get_icon_svg_inline(icon_name: str, size: int = 48, color: str = "#999999")
 debug_no_css = False
 
 # WOTA風シンプルなカスタムCSS（視認性重視・コントラスト確保）
-def get_custom_css():
-    """カスタムCSSを生成（WOTA風シンプルデザイン・コントラスト確保）"""
-    return f"""
+# カスタムCSS本体（差し込む値が無い静的CSSなので、rerunごとにf-stringを評価しない）
+_CUSTOM_CSS = """
 <style>
     /* CSS変数（コントラスト確保のための共通ルール） */
-    :root {{
+    :root {
         --bg: #ffffff;
         --text: #111111;
         --muted: #666666;
@@ -201,42 +203,42 @@ def get_custom_css():
         --border: #e5e5e5;
         --primary: #1a1a1a;
         --on-primary: #ffffff;
-    }}
+    }
     
     /* ベースフォント - シンプルなサンセリフ（WOTA風） */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
     
-    * {{
+    * {
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Helvetica Neue', Arial, sans-serif !important;
-    }}
+    }
     
     /* ベース文字色を確保（視認性向上） */
-    html, body, [class*="st-"], p, span, div, h1, h2, h3, h4, h5, h6 {{
+    html, body, [class*="st-"], p, span, div, h1, h2, h3, h4, h5, h6 {
         color: var(--text) !important;
-    }}
+    }
     
     /* メイン背景 - WOTA風シンプル（白背景） */
-    .stApp {{
+    .stApp {
         background: #ffffff;
         position: relative;
         min-height: 100vh;
-    }}
+    }
     
-    .stApp::before {{
+    .stApp::before {
         display: none;
-    }}
+    }
     
-    .main .block-container {{
+    .main .block-container {
         padding-top: 2rem;
         padding-bottom: 2rem;
         position: relative;
         z-index: 10;
         background: transparent;
         max-width: 1200px;
-    }}
+    }
     
     /* ヘッダー - WOTA風シンプルデザイン */
-    .main-header {{
+    .main-header {
         font-size: 2.5rem;
         font-weight: 600;
         color: #1a1a1a;
@@ -247,31 +249,31 @@ def get_custom_css():
         z-index: 2;
         line-height: 1.3;
         margin-top: 0;
-    }}
+    }
     
-    .main-header::after {{
+    .main-header::after {
         display: none;
-    }}
+    }
     
     /* サブ背景画像を装飾として使用（非表示に変更 - 白飛び防止） */
-    .material-decoration {{
+    .material-decoration {
         display: none;
         position: absolute;
         opacity: 0.05;
         z-index: -1;
         pointer-events: none;
-    }}
+    }
     
-    .decoration-1 {{
+    .decoration-1 {
         display: none;
-    }}
+    }
     
-    .decoration-2 {{
+    .decoration-2 {
         display: none;
-    }}
+    }
     
     /* カードスタイル - WOTA風シンプル */
-    .material-card-container {{
+    .material-card-container {
         background: #ffffff;
         border-radius: 0;
         padding: 32px;
@@ -281,9 +283,9 @@ def get_custom_css():
         border: 1px solid rgba(0, 0, 0, 0.08);
         position: relative;
         overflow: hidden;
-    }}
+    }
     
-    .material-card-container::before {{
+    .material-card-container::before {
         content: '';
         position: absolute;
         top: 0;
@@ -292,16 +294,16 @@ def get_custom_css():
         height: 2px;
         background: #1a1a1a;
         opacity: 1;
-    }}
+    }
     
-    .material-card-container:hover {{
+    .material-card-container:hover {
         transform: translateY(-2px);
         box-shadow: 0 4px 12px rgba(0, 0, 0, 0.12);
         border-color: rgba(0, 0, 0, 0.15);
-    }}
+    }
     
     /* カテゴリバッジ - 読みやすく、タグとして表示 */
-    .category-badge {{
+    .category-badge {
         display: inline-block;
         background: #f0f0f0;
         color: #1a1a1a;
@@ -320,20 +322,20 @@ def get_custom_css():
         word-wrap: break-word;
         overflow-wrap: break-word;
         white-space: normal;
-    }}
+    }
     
     /* 素材画像のヒーロー領域 */
-    .material-hero-image {{
+    .material-hero-image {
         width: 100%;
         aspect-ratio: 16 / 9;
         object-fit: cover;
         background: #f5f5f5;
         border-radius: 0;
         margin-bottom: 16px;
-    }}
+    }
     
     /* 統計カード - WOTA風シンプル */
-    .stat-card {{
+    .stat-card {
         background: #ffffff;
         border-radius: 0;
         padding: 32px;
@@ -344,14 +346,14 @@ def get_custom_css():
         border-top: 2px solid #1a1a1a;
         position: relative;
         overflow: hidden;
-    }}
+    }
     
-    .stat-card:hover {{
+    .stat-card:hover {
         transform: translateY(-2px);
         box-shadow: 0 4px 12px rgba(0, 0, 0, 0.12);
-    }}
+    }
     
-    .stat-value {{
+    .stat-value {
         font-size: 2.5rem;
         font-weight: 600;
         color: #1a1a1a;
@@ -359,9 +361,9 @@ def get_custom_css():
         position: relative;
         z-index: 1;
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }}
+    }
     
-    .stat-label {{
+    .stat-label {
         color: #666666;
         font-size: 14px;
         font-weight: 400;
@@ -370,7 +372,7 @@ def get_custom_css():
         position: relative;
         z-index: 1;
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }}
+    }
     
     /* ボタンスタイル - WOTA風シンプル（コントラスト確保・白文字強制） */
     .stButton>button,
@@ -379,7 +381,7 @@ def get_custom_css():
     [data-testid="baseButton-primary"],
     [data-testid="baseButton-secondary"] button,
     [data-testid="baseButton-primary"] button,
-    button[type="button"] {{
+    button[type="button"] {
         background: #1a1a1a !important;
         color: #ffffff !important;
         border: 1px solid #1a1a1a !important;
@@ -392,7 +394,7 @@ def get_custom_css():
         letter-spacing: 0;
         font-size: 15px;
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }}
+    }
     
     .stButton>button *,
     button[data-baseweb="button"] *,
@@ -400,27 +402,27 @@ def get_custom_css():
     [data-testid="baseButton-primary"] *,
     button[type="button"] *,
     .stButton>button span,
-    button[data-baseweb="button"] span {{
+    button[data-baseweb="button"] span {
         color: #ffffff !important;
-    }}
+    }
     
     .stButton>button:hover,
     button[data-baseweb="button"]:hover,
     [data-testid="baseButton-secondary"]:hover button,
     [data-testid="baseButton-primary"]:hover button,
-    button[type="button"]:hover {{
+    button[type="button"]:hover {
         background: #333333 !important;
         border-color: #333333 !important;
         color: #ffffff !important;
         transform: none;
         box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-    }}
+    }
     
     .stButton>button:hover *,
     button[data-baseweb="button"]:hover *,
-    button[type="button"]:hover * {{
+    button[type="button"]:hover * {
         color: #ffffff !important;
-    }}
+    }
     
     /* 黒背景のヘッダー/バー部分の文字色を白に統一 */
     [style*="background: #1a1a1a"],
@@ -428,14 +430,14 @@ def get_custom_css():
     [style*="background-color: #1a1a1a"],
     [style*="background-color:#1a1a1a"],
     .black-bar,
-    .dark-header {{
+    .dark-header {
         color: #ffffff !important;
-    }}
+    }
     
     .black-bar *,
-    .dark-header * {{
+    .dark-header * {
         color: #ffffff !important;
-    }}
+    }
     
     /* Streamlitのヘッダーバーの文字色を白に */
     [data-testid="stHeader"],
@@ -445,27 +447,27 @@ def get_custom_css():
     [data-testid="stHeader"] p,
     [data-testid="stHeader"] span,
     [data-testid="stHeader"] div,
-    [data-testid="stHeader"] a {{
+    [data-testid="stHeader"] a {
         color: #ffffff !important;
-    }}
+    }
     
     /* Streamlitのメニューボタン（ハンバーガーメニュー）の色 */
     [data-testid="stHeader"] button,
     [data-testid="stHeader"] button *,
     header[data-testid="stHeader"] button,
-    header[data-testid="stHeader"] button * {{
+    header[data-testid="stHeader"] button * {
         color: #ffffff !important;
         fill: #ffffff !important;
         stroke: #ffffff !important;
-    }}
+    }
     
     /* Streamlitのツールバー（右上のメニュー） */
     [data-testid="stToolbar"],
     [data-testid="stToolbar"] *,
     [data-testid="stToolbar"] button,
-    [data-testid="stToolbar"] button * {{
+    [data-testid="stToolbar"] button * {
         color: #ffffff !important;
-    }}
+    }
     
     /* 黒背景の任意の要素 */
     div[style*="background: #1a1a1a"],
@@ -473,54 +475,54 @@ def get_custom_css():
     div[style*="background-color: #1a1a1a"],
     div[style*="background-color:#1a1a1a"],
     section[style*="background: #1a1a1a"],
-    section[style*="background:#1a1a1a"] {{
+    section[style*="background:#1a1a1a"] {
         color: #ffffff !important;
-    }}
+    }
     
     div[style*="background: #1a1a1a"] *,
     div[style*="background:#1a1a1a"] *,
     div[style*="background-color: #1a1a1a"] *,
     div[style*="background-color:#1a1a1a"] *,
     section[style*="background: #1a1a1a"] *,
-    section[style*="background:#1a1a1a"] * {{
+    section[style*="background:#1a1a1a"] * {
         color: #ffffff !important;
-    }}
+    }
     
     /* サイドバー - WOTA風シンプル */
-    [data-testid="stSidebar"] {{
+    [data-testid="stSidebar"] {
         background: rgba(255, 255, 255, 0.95);
         backdrop-filter: blur(10px);
         border-right: 1px solid rgba(0, 0, 0, 0.08);
-    }}
+    }
     
-    [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] {{
+    [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] {
         color: #1a1a1a;
         font-weight: 400;
-    }}
+    }
     
     /* ラジオボタン - シンプルなメニュー */
-    [data-testid="stRadio"] label {{
+    [data-testid="stRadio"] label {
         font-size: 15px;
         font-weight: 400;
         color: #1a1a1a;
         padding: 8px 12px;
         border-radius: 4px;
         transition: background 0.2s ease;
-    }}
+    }
     
-    [data-testid="stRadio"] label:hover {{
+    [data-testid="stRadio"] label:hover {
         background: rgba(0, 0, 0, 0.04);
-    }}
+    }
     
-    [data-testid="stRadio"] input[type="radio"]:checked + label {{
+    [data-testid="stRadio"] input[type="radio"]:checked + label {
         background: rgba(0, 0, 0, 0.08);
         font-weight: 500;
-    }}
+    }
     
     /* 入力フィールド - WOTA風シンプル */
     .stTextInput>div>div>input,
     .stTextArea>div>div>textarea,
-    .stSelectbox>div>div>select {{
+    .stSelectbox>div>div>select {
         border-radius: 4px;
         border: 1px solid rgba(0, 0, 0, 0.15);
         background: #ffffff;
@@ -528,41 +530,41 @@ def get_custom_css():
         box-shadow: none;
         font-size: 15px;
         padding: 0.5rem 0.75rem;
-    }}
+    }
     
     .stTextInput>div>div>input:focus,
     .stTextArea>div>div>textarea:focus,
-    .stSelectbox>div>div>select:focus {{
+    .stSelectbox>div>div>select:focus {
         border-color: #1a1a1a;
         box-shadow: 0 0 0 2px rgba(26, 26, 26, 0.1);
         background: #ffffff;
         outline: none;
-    }}
+    }
     
     /* メトリクス - WOTA風 */
-    [data-testid="stMetricValue"] {{
+    [data-testid="stMetricValue"] {
         font-size: 2rem;
         font-weight: 600;
         color: #1a1a1a;
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }}
+    }
     
-    [data-testid="stMetricLabel"] {{
+    [data-testid="stMetricLabel"] {
         font-size: 14px;
         font-weight: 400;
         color: #666666;
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }}
+    }
     
     /* グラデーションテキスト - WOTA風シンプル（削除） */
     
     /* マテリアル装飾要素 */
-    .material-texture {{
+    .material-texture {
         position: relative;
         overflow: hidden;
-    }}
+    }
     
-    .material-texture::after {{
+    .material-texture::after {
         content: '';
         position: absolute;
         top: 0;
@@ -575,18 +577,18 @@ def get_custom_css():
         opacity: 0.03;
         pointer-events: none;
         mix-blend-mode: multiply;
-    }}
+    }
     
     /* カードグリッド */
-    .card-grid {{
+    .card-grid {
         display: grid;
         grid-template-columns: repeat(auto-fill, minmax(320px, 1fr));
         gap: 25px;
         margin: 30px 0;
-    }}
+    }
     
     /* ヒーローセクション - WOTA風シンプル */
-    .hero-section {{
+    .hero-section {
         background: #ffffff;
         border-radius: 0;
         padding: 40px 0;
@@ -597,14 +599,14 @@ def get_custom_css():
         border-bottom: 1px solid rgba(0, 0, 0, 0.08);
         position: relative;
         overflow: hidden;
-    }}
+    }
     
-    .hero-section::before {{
+    .hero-section::before {
         display: none;
-    }}
+    }
     
     /* セクションタイトル - WOTA風 */
-    .section-title {{
+    .section-title {
         font-size: 2rem;
         font-weight: 600;
         color: #1a1a1a;
@@ -614,9 +616,9 @@ def get_custom_css():
         padding-bottom: 16px;
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
         letter-spacing: -0.01em;
-    }}
+    }
     
-    .section-title::after {{
+    .section-title::after {
         content: '';
         display: block;
         width: 40px;
@@ -624,25 +626,25 @@ def get_custom_css():
         background: #1a1a1a;
         margin: 16px 0 0;
         border-radius: 0;
-    }}
+    }
     
     /* 見出しの視認性向上 */
-    h1, h2, h3, h4, h5, h6 {{
+    h1, h2, h3, h4, h5, h6 {
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif !important;
         font-weight: 600 !important;
         color: #1a1a1a !important;
         letter-spacing: -0.01em;
-    }}
+    }
     
     /* 本文の視認性向上 */
-    p, span, div, li {{
+    p, span, div, li {
         font-size: 15px;
         line-height: 1.6;
         color: #1a1a1a;
-    }}
+    }
     
     /* 統計情報を左下に固定表示 */
-    .stats-fixed {{
+    .stats-fixed {
         position: fixed;
         bottom: 20px;
         left: 20px;
@@ -654,78 +656,83 @@ def get_custom_css():
         z-index: 1000;
         box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
         font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }}
+    }
     
-    .stats-fixed div {{
+    .stats-fixed div {
         margin: 2px 0;
-    }}
+    }
     
-    .stats-fixed strong {{
+    .stats-fixed strong {
         color: #1a1a1a;
         font-weight: 600;
-    }}
+    }
     
     /* サイトヘッダー（ロゴ表示用） */
-    .site-header {{
+    .site-header {
         display: flex;
         align-items: flex-start;
         gap: 12px;
         margin-top: 4px;
         margin-bottom: 12px;
-    }}
+    }
     
-    .site-title-block {{
+    .site-title-block {
         display: flex;
         flex-direction: column;
         align-items: flex-start;
         gap: 0;
-    }}
+    }
     
-    .site-logo svg {{
+    .site-logo svg {
         height: 36px;
         width: auto;
         vertical-align: middle;
-    }}
+    }
     
-    .site-mark {{
+    .site-mark {
         /* サイズは render_logo_mark(height_px=72) の inline style で指定 */
         /* ここでは余白や整列のみ */
-    }}
+    }
     
-    .site-logo-fallback {{
+    .site-logo-fallback {
         font-size: 36px;
         font-weight: 600;
         color: #1a1a1a;
-    }}
+    }
     
-    .site-subtitle {{
+    .site-subtitle {
         font-size: 14px;
         color: #666;
         margin-top: 8px;
-    }}
+    }
     
     /* モバイル対応（画面幅が小さい場合） */
-    @media (max-width: 768px) {{
-        .site-header {{
+    @media (max-width: 768px) {
+        .site-header {
             flex-direction: column;
             align-items: flex-start;
             gap: 8px;
-        }}
+        }
         
-        .site-logo svg {{
+        .site-logo svg {
             height: 28px;
-        }}
+        }
         
         /* ロゴマークのサイズは render_logo_mark(height_px=72) の inline style で指定 */
         
-        .site-subtitle {{
+        .site-subtitle {
             margin-top: 8px;
             line-height: 1.4;
-        }}
-    }}
+        }
+    }
 </style>
 """
 
+
+def get_custom_css():
+    """カスタムCSSを生成（WOTA風シンプルデザイン・コントラスト確保）"""
+    return _CUSTOM_CSS
+
 # データベース初期化
 # DB初期化（常に実行：既存DBでも不足カラムを自動追加）
 init_db()
@@ -904,6 +911,29 @@ def get_material_by_id(material_id: int):
     finally:
         db.close()
 
+def get_material_options(include_unpublished: bool = False, include_deleted: bool = False):
+    """
+    選択肢用に材料のID・名称だけを取得（リレーションは読み込まない）
+
+    Args:
+        include_unpublished: Trueの場合、非公開（is_published=0）も含める
+        include_deleted: Trueの場合、論理削除済み（is_deleted=1）も含める
+
+    Returns:
+        (id, name_official, name) の行リスト
+    """
+    db = get_db()
+    try:
+        stmt = select(Material.id, Material.name_official, Material.name)
+        if not include_deleted:
+            stmt = stmt.filter(Material.is_deleted == 0)
+        if not include_unpublished:
+            stmt = stmt.filter(Material.is_published == 1)
+        stmt = stmt.order_by(Material.created_at.desc())
+        return db.execute(stmt).all()
+    finally:
+        db.close()
+
 def create_material(name, category, description, properties_data):
     """材料を作成"""
     db = get_db()
@@ -936,8 +966,8 @@ def create_material(name, category, description, properties_data):
 
 def generate_qr_code(material_id: int):
     """QRコードを生成（後方互換性のため残すが、新しいコードではgenerate_qr_png_bytesを使用）"""
-    from utils.qr import generate_qr_png_bytes
-    qr_bytes = generate_qr_png_bytes(f"Material ID: {material_id}")
+    from utils.qr import generate_material_qr_png_bytes
+    qr_bytes = generate_material_qr_png_bytes(material_id)
     if qr_bytes:
         from PIL import Image as PILImage
         from io import BytesIO
@@ -2119,7 +2149,7 @@ def show_home():
                             from utils.image_display import to_png_bytes
                             png_bytes = to_png_bytes(image_source, max_size=(120, 120))
                             if png_bytes:
-                                img_base64 = base64.b64encode(png_bytes).decode()
+                                img_base64 = b64encode(png_bytes).decode()
                                 # 画像のハッシュをキーとして使用（キャッシュ対策）
                                 img_hash = hashlib.md5(png_bytes).hexdigest()[:8]
                                 st.image(f"data:image/png;base64,{img_base64}", width=120)
@@ -2331,7 +2361,7 @@ def show_materials_list(include_unpublished: bool = False, include_deleted: bool
                             if path.exists() and path.is_file():
                                 with open(path, 'rb') as f:
                                     img_bytes = f.read()
-                                    img_base64 = base64.b64encode(img_bytes).decode()
+                                    img_base64 = b64encode(img_bytes).decode()
                                     # 拡張子からMIMEタイプを判定
                                     ext = path.suffix.lower()
                                     mime_type = {
@@ -2354,7 +2384,7 @@ def show_materials_list(include_unpublished: bool = False, include_deleted: bool
                             # to_data_urlが失敗した場合はto_png_bytesでPNG bytes化
                             png_bytes = to_png_bytes(image_source)
                             if png_bytes:
-                                img_base64 = base64.b64encode(png_bytes).decode()
+                                img_base64 = b64encode(png_bytes).decode()
                                 img_html = f'<img src="data:image/png;base64,{img_base64}" class="material-hero-image" alt="{material_name}" />'
                             else:
                                 img_html = f'<div class="material-hero-image" style="display: flex; align-items: center; justify-content: center; color: #999; font-size: 14px;">画像なし</div>'
@@ -2363,7 +2393,7 @@ def show_materials_list(include_unpublished: bool = False, include_deleted: bool
                         from utils.image_display import to_png_bytes
                         png_bytes = to_png_bytes(image_source)
                         if png_bytes:
-                            img_base64 = base64.b64encode(png_bytes).decode()
+                            img_base64 = b64encode(png_bytes).decode()
                             img_html = f'<img src="data:image/png;base64,{img_base64}" class="material-hero-image" alt="{material_name}" />'
                         else:
                             img_html = f'<div class="material-hero-image" style="display: flex; align-items: center; justify-content: center; color: #999; font-size: 14px;">画像なし</div>'
@@ -2625,14 +2655,24 @@ def show_search():
     
     if search_query:
         materials = get_all_materials(include_unpublished=include_unpublished)
-        results = []
         
-        for material in materials:
-            # 材料名、カテゴリ、説明で検索
-            if (search_query.lower() in material.name.lower() or
-                (material.category and search_query.lower() in material.category.lower()) or
-                (material.description and search_query.lower() in material.description.lower())):
-                results.append(material)
+        # 3文字以上は全文検索インデックスで一致IDを引く（材料ごとの文字列比較をしない）
+        db = get_db()
+        try:
+            matched_ids = search_material_ids(db, search_query)
+        finally:
+            db.close()
+        
+        if matched_ids is not None:
+            results = [material for material in materials if material.id in matched_ids]
+        else:
+            results = []
+            for material in materials:
+                # 材料名、カテゴリ、説明で検索
+                if (search_query.lower() in material.name.lower() or
+                    (material.category and search_query.lower() in material.category.lower()) or
+                    (material.description and search_query.lower() in material.description.lower())):
+                    results.append(material)
         
         if results:
             st.success(f"**{len(results)}件**の結果が見つかりました")
@@ -2685,7 +2725,7 @@ def show_search():
                                             # to_data_urlが失敗した場合はto_png_bytesでPNG bytes化
                                             png_bytes = to_png_bytes(path)
                                             if png_bytes:
-                                                img_base64 = base64.b64encode(png_bytes).decode()
+                                                img_base64 = b64encode(png_bytes).decode()
                                                 img_html = f'<img src="data:image/png;base64,{img_base64}" class="material-hero-image" alt="{material.name}" />'
                                             else:
                                                 img_html = f'<div class="material-hero-image" style="display: flex; align-items: center; justify-content: center; color: #999; font-size: 14px;">画像なし</div>'
@@ -2701,7 +2741,7 @@ def show_search():
                                     # to_data_urlが失敗した場合はto_png_bytesでPNG bytes化
                                     png_bytes = to_png_bytes(image_source)
                                     if png_bytes:
-                                        img_base64 = base64.b64encode(png_bytes).decode()
+                                        img_base64 = b64encode(png_bytes).decode()
                                         img_html = f'<img src="data:image/png;base64,{img_base64}" class="material-hero-image" alt="{material.name}" />'
                                     else:
                                         img_html = f'<div class="material-hero-image" style="display: flex; align-items: center; justify-content: center; color: #999; font-size: 14px;">画像なし</div>'
@@ -2710,7 +2750,7 @@ def show_search():
                                 from utils.image_display import to_png_bytes
                                 png_bytes = to_png_bytes(image_source)
                                 if png_bytes:
-                                    img_base64 = base64.b64encode(png_bytes).decode()
+                                    img_base64 = b64encode(png_bytes).decode()
                                     img_html = f'<img src="data:image/png;base64,{img_base64}" class="material-hero-image" alt="{material.name}" />'
                                 else:
                                     img_html = f'<div class="material-hero-image" style="display: flex; align-items: center; justify-content: center; color: #999; font-size: 14px;">画像なし</div>'
@@ -2813,7 +2853,7 @@ def show_approval_queue():
             filtered_submissions = []
             for sub in all_submissions:
                 try:
-                    payload = json.loads(sub.payload_json)
+                    payload = sub.payload
                     name_official = payload.get('name_official', '')
                     if search_query.lower() in name_official.lower():
                         filtered_submissions.append(sub)
@@ -2860,7 +2900,7 @@ def show_approval_queue():
             ):
                 # payload_jsonをパースして表示
                 try:
-                    payload = json.loads(submission.payload_json)
+                    payload = submission.payload
                     st.markdown("### 投稿内容")
                     
                     # 主要フィールドを表示
@@ -2974,7 +3014,7 @@ def show_approval_queue():
                     
                     elif submission.status == "approved":
                         if submission.approved_material_id:
-                            material = db.query(Material).filter(Material.id == submission.approved_material_id).first()
+                            material = db.execute(_GET_MATERIAL, {"id": submission.approved_material_id}).scalar_one_or_none()
                             if material:
                                 st.info(f"✅ 承認済み材料: {material.name_official} (ID: {material.id})")
                                 st.info(f"📢 公開状態: {'公開' if material.is_published == 1 else '非公開'}")
@@ -2990,6 +3030,18 @@ def show_approval_queue():
         db.close()
 
 
+# 承認フローで繰り返し使う主キー検索（lambda_stmtでSQLのコンパイル結果をキャッシュ）
+_GET_SUBMISSION = lambda_stmt(
+    lambda: select(MaterialSubmission).where(MaterialSubmission.id == bindparam("id"))
+)
+_GET_MATERIAL = lambda_stmt(
+    lambda: select(Material).where(Material.id == bindparam("id"))
+)
+
+# 承認時にpayloadから反映してよいMaterialのカラム名
+_MATERIAL_COLUMNS = frozenset(c.key for c in Material.__table__.columns) - {"id"}
+
+
 def approve_submission(submission_id: int, editor_note: str = None, db=None):
     """
     投稿を承認してmaterialsテーブルに反映
@@ -3010,9 +3062,7 @@ def approve_submission(submission_id: int, editor_note: str = None, db=None):
     
     try:
         # submissionを取得
-        submission = db.query(MaterialSubmission).filter(
-            MaterialSubmission.id == submission_id
-        ).first()
+        submission = db.execute(_GET_SUBMISSION, {"id": submission_id}).scalar_one_or_none()
         
         if not submission:
             return {"ok": False, "error": "Submission not found"}
@@ -3022,7 +3072,7 @@ def approve_submission(submission_id: int, editor_note: str = None, db=None):
         
         # payload_jsonをパース
         try:
-            form_data = json.loads(submission.payload_json)
+            form_data = submission.payload
         except json.JSONDecodeError as e:
             return {"ok": False, "error": f"Failed to parse payload_json: {e}"}
         
@@ -3034,118 +3084,121 @@ def approve_submission(submission_id: int, editor_note: str = None, db=None):
             Material.name_official == form_data.get('name_official')
         ).first()
         
+        # payloadのうちMaterialのカラムだけを反映（Noneはスキップ、リスト・辞書はJSON文字列化）
+        values = {
+            k: _json_dumps(v) if isinstance(v, (list, dict)) else v
+            for k, v in form_data.items()
+            if v is not None and k in _MATERIAL_COLUMNS
+        }
+        # 承認時は削除されていない状態にする（公開は後でトグルON）
+        values['is_published'] = 0  # 承認後、編集者が確認してから公開
+        values['is_deleted'] = 0
+        
         if existing_material:
-            # 既存レコードを更新
-            material = existing_material
+            # 既存レコードを1回のUPDATEで更新
+            material_id = existing_material.id
             action = 'updated'
+            db.execute(update(Material).where(Material.id == material_id).values(**values))
         else:
-            # 新規レコードを作成
-            material_uuid = str(uuid.uuid4())
-            material = Material(uuid=material_uuid)
-            db.add(material)
+            # 新規レコードを作成（必須フィールド・既定値を上書きで設定）
             action = 'created'
-        
-        # 必須フィールドを設定（Noneはスキップ）
-        for k, v in form_data.items():
-            if v is None:
-                continue
-            setattr(material, k, v)
-        
-        # 承認時は削除されていない状態にする（公開は後でトグルON）
-        material.is_published = 0  # 承認後、編集者が確認してから公開
-        material.is_deleted = 0
-        
-        # Materialデータを設定（新規の場合）
-        if action == 'created':
-            material.name_official = form_data['name_official']
-            material.name_aliases = json.dumps(form_data.get('name_aliases', []), ensure_ascii=False)
-            material.supplier_org = form_data['supplier_org']
-            material.supplier_type = form_data['supplier_type']
-            material.supplier_other = form_data.get('supplier_other')
-            material.category_main = form_data['category_main']
-            material.category_other = form_data.get('category_other')
-            material.material_forms = json.dumps(form_data['material_forms'], ensure_ascii=False)
-            material.material_forms_other = form_data.get('material_forms_other')
-            material.origin_type = form_data['origin_type']
-            material.origin_other = form_data.get('origin_other')
-            material.origin_detail = form_data['origin_detail']
-            material.recycle_bio_rate = form_data.get('recycle_bio_rate')
-            material.recycle_bio_basis = form_data.get('recycle_bio_basis')
-            material.color_tags = json.dumps(form_data.get('color_tags', []), ensure_ascii=False)
-            material.transparency = form_data['transparency']
-            material.hardness_qualitative = form_data['hardness_qualitative']
-            material.hardness_value = form_data.get('hardness_value')
-            material.weight_qualitative = form_data['weight_qualitative']
-            material.specific_gravity = form_data.get('specific_gravity')
-            material.water_resistance = form_data['water_resistance']
-            material.heat_resistance_temp = form_data.get('heat_resistance_temp')
-            material.heat_resistance_range = form_data['heat_resistance_range']
-            material.weather_resistance = form_data['weather_resistance']
-            material.processing_methods = json.dumps(form_data['processing_methods'], ensure_ascii=False)
-            material.processing_other = form_data.get('processing_other')
-            material.equipment_level = form_data['equipment_level']
-            material.prototyping_difficulty = form_data['prototyping_difficulty']
-            material.use_categories = json.dumps(form_data['use_categories'], ensure_ascii=False)
-            material.use_other = form_data.get('use_other')
-            material.procurement_status = form_data['procurement_status']
-            material.cost_level = form_data['cost_level']
-            material.cost_value = form_data.get('cost_value')
-            material.cost_unit = form_data.get('cost_unit')
-            material.safety_tags = json.dumps(form_data['safety_tags'], ensure_ascii=False)
-            material.safety_other = form_data.get('safety_other')
-            material.restrictions = form_data.get('restrictions')
-            material.visibility = form_data['visibility']
-            material.is_published = 0  # 承認後、編集者が確認してから公開
-            material.is_deleted = 0
-            # レイヤー②
-            material.development_motives = json.dumps(form_data.get('development_motives', []), ensure_ascii=False)
-            material.development_motive_other = form_data.get('development_motive_other')
-            material.development_background_short = form_data.get('development_background_short')
-            material.development_story = form_data.get('development_story')
-            material.tactile_tags = json.dumps(form_data.get('tactile_tags', []), ensure_ascii=False)
-            material.tactile_other = form_data.get('tactile_other')
-            material.visual_tags = json.dumps(form_data.get('visual_tags', []), ensure_ascii=False)
-            material.visual_other = form_data.get('visual_other')
-            material.sound_smell = form_data.get('sound_smell')
-            material.circularity = form_data.get('circularity')
-            material.certifications = json.dumps(form_data.get('certifications', []), ensure_ascii=False)
-            material.certifications_other = form_data.get('certifications_other')
-            material.main_elements = form_data.get('main_elements')
-            # 後方互換性
-            material.name = form_data['name_official']
-            material.category = form_data['category_main']
-        
-        db.flush()
-        
-        # 参照URL保存
-        if action == 'updated':
-            db.query(ReferenceURL).filter(ReferenceURL.material_id == material.id).delete()
-        for ref in form_data.get('reference_urls', []):
-            if ref.get('url'):
-                ref_url = ReferenceURL(
-                    material_id=material.id,
-                    url=ref['url'],
-                    url_type=ref.get('type'),
-                    description=ref.get('desc')
-                )
-                db.add(ref_url)
-        
-        # 使用例保存
-        if action == 'updated':
-            db.query(UseExample).filter(UseExample.material_id == material.id).delete()
-        for ex in form_data.get('use_examples', []):
-            if ex.get('name'):
-                use_ex = UseExample(
-                    material_id=material.id,
-                    example_name=ex['name'],
-                    example_url=ex.get('url'),
-                    description=ex.get('desc')
-                )
-                db.add(use_ex)
+            values.update({
+                'uuid': str(uuid.uuid4()),
+                'name_official': form_data['name_official'],
+                'name_aliases': _json_dumps(form_data.get('name_aliases', [])),
+                'supplier_org': form_data['supplier_org'],
+                'supplier_type': form_data['supplier_type'],
+                'supplier_other': form_data.get('supplier_other'),
+                'category_main': form_data['category_main'],
+                'category_other': form_data.get('category_other'),
+                'material_forms': _json_dumps(form_data['material_forms']),
+                'material_forms_other': form_data.get('material_forms_other'),
+                'origin_type': form_data['origin_type'],
+                'origin_other': form_data.get('origin_other'),
+                'origin_detail': form_data['origin_detail'],
+                'recycle_bio_rate': form_data.get('recycle_bio_rate'),
+                'recycle_bio_basis': form_data.get('recycle_bio_basis'),
+                'color_tags': _json_dumps(form_data.get('color_tags', [])),
+                'transparency': form_data['transparency'],
+                'hardness_qualitative': form_data['hardness_qualitative'],
+                'hardness_value': form_data.get('hardness_value'),
+                'weight_qualitative': form_data['weight_qualitative'],
+                'specific_gravity': form_data.get('specific_gravity'),
+                'water_resistance': form_data['water_resistance'],
+                'heat_resistance_temp': form_data.get('heat_resistance_temp'),
+                'heat_resistance_range': form_data['heat_resistance_range'],
+                'weather_resistance': form_data['weather_resistance'],
+                'processing_methods': _json_dumps(form_data['processing_methods']),
+                'processing_other': form_data.get('processing_other'),
+                'equipment_level': form_data['equipment_level'],
+                'prototyping_difficulty': form_data['prototyping_difficulty'],
+                'use_categories': _json_dumps(form_data['use_categories']),
+                'use_other': form_data.get('use_other'),
+                'procurement_status': form_data['procurement_status'],
+                'cost_level': form_data['cost_level'],
+                'cost_value': form_data.get('cost_value'),
+                'cost_unit': form_data.get('cost_unit'),
+                'safety_tags': _json_dumps(form_data['safety_tags']),
+                'safety_other': form_data.get('safety_other'),
+                'restrictions': form_data.get('restrictions'),
+                'visibility': form_data['visibility'],
+                'is_published': 0,  # 承認後、編集者が確認してから公開
+                'is_deleted': 0,
+                # レイヤー②
+                'development_motives': _json_dumps(form_data.get('development_motives', [])),
+                'development_motive_other': form_data.get('development_motive_other'),
+                'development_background_short': form_data.get('development_background_short'),
+                'development_story': form_data.get('development_story'),
+                'tactile_tags': _json_dumps(form_data.get('tactile_tags', [])),
+                'tactile_other': form_data.get('tactile_other'),
+                'visual_tags': _json_dumps(form_data.get('visual_tags', [])),
+                'visual_other': form_data.get('visual_other'),
+                'sound_smell': form_data.get('sound_smell'),
+                'circularity': form_data.get('circularity'),
+                'certifications': _json_dumps(form_data.get('certifications', [])),
+                'certifications_other': form_data.get('certifications_other'),
+                'main_elements': form_data.get('main_elements'),
+                # 後方互換性
+                'name': form_data['name_official'],
+                'category': form_data['category_main'],
+            })
+            # INSERT ... RETURNINGでidを受け取り、flushの往復を省く
+            material_id = db.execute(
+                insert(Material).values(**values).returning(Material.id)
+            ).scalar_one()
+        
+        # 子テーブル（参照URL・使用例）はSAVEPOINT内で差し替え、コミットは最後の1回のみ
+        with db.begin_nested():
+            # 参照URL保存
+            if action == 'updated':
+                db.query(ReferenceURL).filter(ReferenceURL.material_id == material_id).delete()
+            for ref in form_data.get('reference_urls', []):
+                if ref.get('url'):
+                    ref_url = ReferenceURL(
+                        material_id=material_id,
+                        url=ref['url'],
+                        url_type=ref.get('type'),
+                        description=ref.get('desc')
+                    )
+                    db.add(ref_url)
+        
+        with db.begin_nested():
+            # 使用例保存
+            if action == 'updated':
+                db.query(UseExample).filter(UseExample.material_id == material_id).delete()
+            for ex in form_data.get('use_examples', []):
+                if ex.get('name'):
+                    use_ex = UseExample(
+                        material_id=material_id,
+                        example_name=ex['name'],
+                        example_url=ex.get('url'),
+                        description=ex.get('desc')
+                    )
+                    db.add(use_ex)
         
         # submissionを更新
         submission.status = "approved"
-        submission.approved_material_id = material.id
+        submission.approved_material_id = material_id
         if editor_note and editor_note.strip():
             submission.editor_note = editor_note.strip()
         
@@ -3153,7 +3206,7 @@ def approve_submission(submission_id: int, editor_note: str = None, db=None):
         
         return {
             "ok": True,
-            "material_id": material.id,
+            "material_id": material_id,
             "action": action,
         }
         
@@ -3170,6 +3223,24 @@ def approve_submission(submission_id: int, editor_note: str = None, db=None):
             db.close()
 
 
+# 差分表示で比較するフィールド（主要なもの）
+_DIFF_FIELDS = (
+    'name_official', 'category_main', 'supplier_org', 'supplier_type',
+    'origin_type', 'origin_detail', 'transparency', 'hardness_qualitative',
+    'weight_qualitative', 'water_resistance', 'heat_resistance_range',
+    'weather_resistance', 'equipment_level', 'prototyping_difficulty',
+    'procurement_status', 'cost_level', 'visibility', 'is_published'
+)
+_DIFF_GETTER = attrgetter(*_DIFF_FIELDS)
+
+
+def _normalize_diff_value(value):
+    """差分比較用にNoneや空白を正規化（文字列はstrip、Noneは空文字列）"""
+    if isinstance(value, str):
+        return value.strip()
+    return "" if value is None else value
+
+
 def calculate_submission_diff(existing_material: Material, payload: dict) -> dict:
     """
     既存材料とsubmission payloadの差分を計算
@@ -3181,33 +3252,17 @@ def calculate_submission_diff(existing_material: Material, payload: dict) -> dic
     Returns:
         dict: {key: (old_value, new_value)} の形式で差分のみを返す
     """
-    diff = {}
+    old_values = tuple(map(_normalize_diff_value, _DIFF_GETTER(existing_material)))
+    new_values = tuple(map(_normalize_diff_value, map(payload.get, _DIFF_FIELDS)))
     
-    # 比較対象のフィールド（主要なもの）
-    compare_fields = [
-        'name_official', 'category_main', 'supplier_org', 'supplier_type',
-        'origin_type', 'origin_detail', 'transparency', 'hardness_qualitative',
-        'weight_qualitative', 'water_resistance', 'heat_resistance_range',
-        'weather_resistance', 'equipment_level', 'prototyping_difficulty',
-        'procurement_status', 'cost_level', 'visibility', 'is_published'
-    ]
+    # 変更なし（よくあるケース）はタプル比較だけで終了
+    if old_values == new_values:
+        return {}
     
-    for field in compare_fields:
-        old_val = getattr(existing_material, field, None)
-        new_val = payload.get(field)
-        
-        # Noneや空文字列を正規化
-        if old_val is None:
-            old_val = ""
-        if new_val is None:
-            new_val = ""
-        if isinstance(old_val, str):
-            old_val = old_val.strip()
-        if isinstance(new_val, str):
-            new_val = new_val.strip()
-        
+    diff = {}
+    for field, old_val, new_val in zip(_DIFF_FIELDS, old_values, new_values):
         # 差分がある場合のみ追加
-        if old_val != new_val and new_val not in (None, ""):
+        if old_val != new_val and new_val != "":
             diff[field] = (str(old_val), str(new_val))
     
     return diff
@@ -3231,21 +3286,21 @@ def reopen_submission(submission_id: int, db=None):
         should_close = False
     
     try:
-        # submissionを取得
-        submission = db.query(MaterialSubmission).filter(
-            MaterialSubmission.id == submission_id
+        # ステータス確認と更新を1文で行う（rejectedの場合のみpendingに戻す）
+        result = db.execute(
+            update(MaterialSubmission)
+            .where(MaterialSubmission.id == submission_id, MaterialSubmission.status == "rejected")
+            .values(status="pending", reject_reason=None)  # 却下理由をクリア
+            .returning(MaterialSubmission.id)
         ).first()
         
-        if not submission:
-            return {"ok": False, "error": "Submission not found"}
-        
-        if submission.status != "rejected":
+        if result is None:
+            # 更新されなかった理由（存在しない / ステータス違い）を確認
+            submission = db.execute(_GET_SUBMISSION, {"id": submission_id}).scalar_one_or_none()
+            if not submission:
+                return {"ok": False, "error": "Submission not found"}
             return {"ok": False, "error": f"Submission is not rejected (status: {submission.status})"}
         
-        # pendingに戻す
-        submission.status = "pending"
-        submission.reject_reason = None  # 却下理由をクリア
-        
         db.commit()
         
         return {"ok": True}
@@ -3282,21 +3337,24 @@ def reject_submission(submission_id: int, reject_reason: str = None, db=None):
         should_close = False
     
     try:
-        # submissionを取得
-        submission = db.query(MaterialSubmission).filter(
-            MaterialSubmission.id == submission_id
+        # ステータス確認と却下処理を1文で行う（pendingの場合のみ却下）
+        result = db.execute(
+            update(MaterialSubmission)
+            .where(MaterialSubmission.id == submission_id, MaterialSubmission.status == "pending")
+            .values(
+                status="rejected",
+                reject_reason=reject_reason if reject_reason and reject_reason.strip() else None,
+            )
+            .returning(MaterialSubmission.id)
         ).first()
         
-        if not submission:
-            return {"ok": False, "error": "Submission not found"}
-        
-        if submission.status != "pending":
+        if result is None:
+            # 更新されなかった理由（存在しない / ステータス違い）を確認
+            submission = db.execute(_GET_SUBMISSION, {"id": submission_id}).scalar_one_or_none()
+            if not submission:
+                return {"ok": False, "error": "Submission not found"}
             return {"ok": False, "error": f"Submission is not pending (status: {submission.status})"}
         
-        # 却下処理
-        submission.status = "rejected"
-        submission.reject_reason = reject_reason if reject_reason and reject_reason.strip() else None
-        
         db.commit()
         
         return {"ok": True}
@@ -3333,9 +3391,7 @@ def show_submission_status():
             # IDまたはUUIDで検索
             submission = None
             if submission_id_input.strip().isdigit():
-                submission = db.query(MaterialSubmission).filter(
-                    MaterialSubmission.id == int(submission_id_input.strip())
-                ).first()
+                submission = db.execute(_GET_SUBMISSION, {"id": int(submission_id_input.strip())}).scalar_one_or_none()
             else:
                 submission = db.query(MaterialSubmission).filter(
                     MaterialSubmission.uuid == submission_id_input.strip()
@@ -3372,7 +3428,7 @@ def show_submission_status():
                 
                 # payload_jsonをパースして表示
                 try:
-                    payload = json.loads(submission.payload_json)
+                    payload = submission.payload
                     st.markdown("---")
                     st.markdown("### 📝 投稿内容")
                     st.write(f"**材料名（正式）**: {payload.get('name_official', 'N/A')}")
@@ -3387,7 +3443,7 @@ def show_submission_status():
                 elif submission.status == "approved":
                     st.success("✅ 承認されました！")
                     if submission.approved_material_id:
-                        material = db.query(Material).filter(Material.id == submission.approved_material_id).first()
+                        material = db.execute(_GET_MATERIAL, {"id": submission.approved_material_id}).scalar_one_or_none()
                         if material:
                             st.info(f"📝 材料名: {material.name_official} (ID: {material.id})")
                             st.info(f"📢 公開状態: {'公開' if material.is_published == 1 else '非公開（管理者が公開するまでお待ちください）'}")
@@ -3411,6 +3467,142 @@ def show_submission_status():
         st.info("💡 投稿IDまたはUUIDを入力してください。")
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_material_option_labels(include_unpublished: bool = False) -> Dict[str, int]:
+    """素材カードのセレクトボックス用 {表示名: material_id}（短いTTLでキャッシュ）"""
+    materials = get_material_options(include_unpublished=include_unpublished)
+    return {f"{m.name_official or m.name or '名称不明'} (ID: {m.id})": m.id for m in materials}
+
+
+# カード生成失敗時のフォールバック（ユーザー入力はautoescapeでエスケープ、テンプレートは起動時に1回だけコンパイル）
+_FALLBACK_CARD_TPL = Environment(autoescape=True).from_string("""
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Material Card - {{ name }}</title>
+    <style>
+        body { font-family: Arial, sans-serif; padding: 20px; }
+        h1 { color: #333; }
+        p { color: #666; }
+    </style>
+</head>
+<body>
+    <h1>{{ name }}</h1>
+    <p><strong>ID:</strong> {{ material_id }}</p>
+    <p><strong>説明:</strong> {{ desc }}</p>
+    <p style="color: #999; font-size: 12px; margin-top: 20px;">※ 詳細なカード生成に失敗しました。基本情報のみ表示しています。</p>
+</body>
+</html>
+""")
+
+
+def _card_fingerprint(material) -> tuple:
+    """
+    素材カードの内容を左右する子テーブル・画像ファイルの指紋を作る
+
+    画像の追加や物性の変更、画像ファイルの差し替えでは materials.updated_at が
+    変わらない（秒単位なので同一秒内の編集も区別できない）ため、これをキャッシュキーに加える。
+
+    Args:
+        material: Materialオブジェクト（images/properties は読み込み済み）
+
+    Returns:
+        ハッシュ可能な指紋タプル
+    """
+    from utils.image_display import get_material_image_ref
+
+    assets = []
+    for kind in ("primary", "space", "product"):
+        try:
+            src, _ = get_material_image_ref(material, kind, project_root=Path.cwd())
+        except Exception:
+            src = None
+        if isinstance(src, Path):
+            # ローカルファイルは更新時刻とサイズで差し替えを検出する
+            try:
+                st_result = src.stat()
+                assets.append((kind, str(src), st_result.st_mtime_ns, st_result.st_size))
+            except OSError:
+                assets.append((kind, str(src), None, None))
+        else:
+            assets.append((kind, src))
+
+    return (
+        material.name, material.name_official, material.category, material.category_main, material.description,
+        tuple((img.id, img.file_path, img.image_type, img.description) for img in material.images),
+        tuple((prop.property_name, prop.value, prop.unit, prop.measurement_condition) for prop in material.properties),
+        tuple(assets),
+    )
+
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _build_card_html(material_id: int, updated_at, fingerprint: tuple, _material) -> str:
+    """
+    素材カード（印刷用）のHTMLを生成
+
+    material_id・updated_at・fingerprint（_card_fingerprint の結果）をキャッシュキーにするため、
+    材料・物性・画像の編集や画像ファイルの差し替えで自動的に再生成される。
+    _material（Materialオブジェクト）はハッシュ対象外。
+    """
+    material = _material
+    # Lazy import: card_generatorとschemas（起動時クラッシュを避けるため）
+    from pydantic import ValidationError
+    from schemas import MaterialCardPayload, MaterialCard, PropertyDTO, PropertyDTOList
+    from card_generator import generate_material_card
+    # 主要画像を取得（画像が無い場合はNone）
+    primary_image = material.images[0] if material.images else None
+    primary_image_path = primary_image.file_path if primary_image else None
+    primary_image_type = primary_image.image_type if primary_image else None
+    primary_image_description = primary_image.description if primary_image else None
+    
+    # 物性データをDTOに変換（まとめて検証し、失敗時のみ1件ずつ検証して不正データをスキップ）
+    raw_properties = [
+        {
+            "property_name": prop.property_name or "不明",
+            "value": prop.value,
+            "unit": prop.unit or None,
+            "measurement_condition": prop.measurement_condition or None,
+        }
+        for prop in material.properties
+    ]
+    try:
+        properties_dto = PropertyDTOList.validate_python(raw_properties)
+    except ValidationError:
+        properties_dto = []
+        for raw in raw_properties:
+            try:
+                properties_dto.append(PropertyDTO.model_validate(raw))
+            except ValidationError as prop_e:
+                # 個別の物性データでエラーが発生しても続行
+                print(f"物性データ変換エラー（スキップ）: {prop_e}")
+    
+    # DTOを作成（欠損はNone/[]に埋める）
+    material_name = material.name or material.name_official or "名称不明"
+    material_name_official = material.name_official
+    material_category = material.category or material.category_main
+    material_category_main = material.category_main
+    material_description = material.description
+    
+    card_payload = MaterialCardPayload(
+        id=int(material.id),
+        name=str(material_name),
+        name_official=str(material_name_official) if material_name_official else None,
+        category=str(material_category) if material_category else None,
+        category_main=str(material_category_main) if material_category_main else None,
+        description=str(material_description) if material_description else None,
+        properties=properties_dto,
+        primary_image_path=str(primary_image_path) if primary_image_path else None,
+        primary_image_type=str(primary_image_type) if primary_image_type else None,
+        primary_image_description=str(primary_image_description) if primary_image_description else None
+    )
+    
+    card_data = MaterialCard(payload=card_payload)
+    # Materialオブジェクトを直接渡せるようにする（画像URL取得のため）
+    # 重要: material_objを必ず設定する（card_generatorで画像取得に必要）
+    card_data.material_obj = material
+    return generate_material_card(card_data)
+
+
 def show_material_cards():
     """素材カード表示ページ（3タブ構造）"""
     is_debug = os.getenv("DEBUG", "0") == "1"
@@ -3420,13 +3612,13 @@ def show_material_cards():
     # 管理者表示フラグを取得
     include_unpublished = st.session_state.get("include_unpublished", False)
     
-    materials = get_all_materials(include_unpublished=include_unpublished)
-    
-    if not materials:
+    # セレクトボックス用はID・名称のみ取得（詳細は選択後にget_material_by_idで先読み）
+    material_options = _get_material_option_labels(include_unpublished)
+
+    if not material_options:
         st.info("材料が登録されていません。")
         return
-    
-    material_options = {f"{m.name_official or m.name or '名称不明'} (ID: {m.id})": m.id for m in materials}
+
     selected_material_name = st.selectbox("材料を選択", list(material_options.keys()))
     material_id = material_options[selected_material_name]
     
@@ -3446,8 +3638,8 @@ def show_material_cards():
         
         with col2:
             # QRコードをPNG bytesとして生成（TypeErrorを防ぐ）
-            from utils.qr import generate_qr_png_bytes
-            qr_bytes = generate_qr_png_bytes(f"Material ID: {material.id}")
+            from utils.qr import generate_material_qr_png_bytes
+            qr_bytes = generate_material_qr_png_bytes(material.id)
             if qr_bytes:
                 st.image(qr_bytes, caption="QRコード", width=150)
             else:
@@ -3460,82 +3652,11 @@ def show_material_cards():
         st.markdown("---")
         st.markdown("### 素材カード（印刷用）")
         
-        # Lazy import: card_generatorとschemas（起動時クラッシュを避けるため）
         card_html = None
         error_message = None
         
         try:
-            # 使用する時だけimportする（lazy import）
-            from schemas import MaterialCardPayload, MaterialCard, PropertyDTO
-            from card_generator import generate_material_card
-            # 主要画像を取得（安全に）
-            primary_image = None
-            primary_image_path = None
-            primary_image_type = None
-            primary_image_description = None
-            
-            try:
-                if hasattr(material, 'images') and material.images and len(material.images) > 0:
-                    primary_image = material.images[0]
-                    primary_image_path = getattr(primary_image, 'file_path', None) if primary_image else None
-                    primary_image_type = getattr(primary_image, 'image_type', None) if primary_image else None
-                    primary_image_description = getattr(primary_image, 'description', None) if primary_image else None
-            except Exception as img_e:
-                print(f"画像取得エラー（続行）: {img_e}")
-            
-            # 物性データをDTOに変換（安全に）
-            properties_dto = []
-            try:
-                if hasattr(material, 'properties') and material.properties:
-                    for prop in material.properties:
-                        try:
-                            prop_name = getattr(prop, 'property_name', None) or "不明"
-                            prop_value = getattr(prop, 'value', None)
-                            prop_unit = getattr(prop, 'unit', None)
-                            prop_condition = getattr(prop, 'measurement_condition', None)
-                            
-                            prop_dto = PropertyDTO(
-                                property_name=str(prop_name),
-                                value=float(prop_value) if prop_value is not None else None,
-                                unit=str(prop_unit) if prop_unit else None,
-                                measurement_condition=str(prop_condition) if prop_condition else None
-                            )
-                            properties_dto.append(prop_dto)
-                        except Exception as prop_e:
-                            # 個別の物性データでエラーが発生しても続行
-                            print(f"物性データ変換エラー（スキップ）: {prop_e}")
-                            continue
-            except Exception as props_e:
-                print(f"物性データ取得エラー（続行）: {props_e}")
-            
-            # DTOを作成（欠損はNone/[]に埋める）
-            material_name = material.name or getattr(material, 'name_official', None) or "名称不明"
-            material_name_official = getattr(material, 'name_official', None)
-            material_category = material.category or getattr(material, 'category_main', None)
-            material_category_main = getattr(material, 'category_main', None)
-            material_description = getattr(material, 'description', None)
-            
-            card_payload = MaterialCardPayload(
-                id=int(material.id),
-                name=str(material_name),
-                name_official=str(material_name_official) if material_name_official else None,
-                category=str(material_category) if material_category else None,
-                category_main=str(material_category_main) if material_category_main else None,
-                description=str(material_description) if material_description else None,
-                properties=properties_dto,
-                primary_image_path=str(primary_image_path) if primary_image_path else None,
-                primary_image_type=str(primary_image_type) if primary_image_type else None,
-                primary_image_description=str(primary_image_description) if primary_image_description else None
-            )
-            
-            card_data = MaterialCard(payload=card_payload)
-            # Materialオブジェクトを直接渡せるようにする（画像URL取得のため）
-            # 重要: material_objを必ず設定する（card_generatorで画像取得に必要）
-            if material is None:
-                st.warning(f"⚠️ material is None for card generation (ID: {card_payload.id})")
-            else:
-                card_data.material_obj = material
-            card_html = generate_material_card(card_data)
+            card_html = _build_card_html(material.id, material.updated_at, _card_fingerprint(material), material)
             
         except Exception as e:
             # ImportError/KeyError/その他すべての例外をキャッチ（ホームは必ず表示される）
@@ -3551,44 +3672,12 @@ def show_material_cards():
                 with st.expander("詳細エラー情報", expanded=False):
                     st.code(error_traceback, language="python")
             
-            # フォールバック：最低限の情報だけのカード
-            try:
-                material_name = material.name or getattr(material, 'name_official', None) or 'Unknown'
-                material_desc = material.description or 'No description'
-                card_html = f"""
-                <html>
-                <head>
-                    <meta charset="utf-8">
-                    <title>Material Card - {material_name}</title>
-                    <style>
-                        body {{ font-family: Arial, sans-serif; padding: 20px; }}
-                        h1 {{ color: #333; }}
-                        p {{ color: #666; }}
-                    </style>
-                </head>
-                <body>
-                    <h1>{material_name}</h1>
-                    <p><strong>ID:</strong> {material.id}</p>
-                    <p><strong>説明:</strong> {material_desc}</p>
-                    <p style="color: #999; font-size: 12px; margin-top: 20px;">※ 詳細なカード生成に失敗しました。基本情報のみ表示しています。</p>
-                </body>
-                </html>
-                """
-            except Exception as fallback_e:
-                # フォールバックも失敗した場合
-                card_html = f"""
-                <html>
-                <head>
-                    <meta charset="utf-8">
-                    <title>Material Card - Error</title>
-                </head>
-                <body>
-                    <h1>カード生成エラー</h1>
-                    <p>材料ID: {material.id if material else 'N/A'}</p>
-                    <p>エラー: {str(fallback_e)}</p>
-                </body>
-                </html>
-                """
+            # フォールバック：最低限の情報だけのカード（materialは取得済みなので属性参照は失敗しない）
+            card_html = _FALLBACK_CARD_TPL.render(
+                name=material.name or material.name_official or 'Unknown',
+                material_id=material.id,
+                desc=material.description or 'No description',
+            )
         
         # HTMLを表示
         if card_html:
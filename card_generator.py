@@ -2,12 +2,23 @@
 素材カード生成モジュール - マテリアル感のあるリッチなデザイン版
 """
 from schemas import MaterialCard
-import qrcode
-from io import BytesIO
-import base64
+import asyncio
 import os
+from jinja2 import Environment, FileSystemLoader
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from string import Template
+from types import MappingProxyType
+from typing import Iterable, List, Optional, TextIO
+from urllib.parse import quote
+
+try:
+    # 非同期ファイル読み込み（generate_material_card_async で画像を並行して読む）
+    import aiofiles
+except ImportError:
+    aiofiles = None
 
 try:
     from utils.image_display import get_material_image_src
@@ -17,186 +28,78 @@ except ImportError:
         return None, {}
 
 
+# 画像を探すディレクトリ（優先順）
+_IMAGE_DIRS = (Path("static/images"), Path("写真"), Path("."))
+
+# カテゴリに応じたカラー（読み取り専用。_card_cssのキャッシュキーになるので書き換えさせない）
+_CATEGORY_COLORS = MappingProxyType({
+    "金属": "#FF6B6B",
+    "プラスチック": "#4ECDC4",
+    "セラミック": "#95E1D3",
+    "複合材料": "#F38181",
+    "その他": "#667eea"
+})
+_DEFAULT_PRIMARY = "#667eea"
+_SECONDARY_COLOR = "#764ba2"
+
+# 画像参照の基準ディレクトリ（カードごとの os.getcwd() 呼び出しを避けるため起動時に1回だけ取得）
+_CWD = Path.cwd()
+
+
 def get_image_path(filename):
     """画像パスを取得"""
-    possible_paths = [
-        Path("static/images") / filename,
-        Path("写真") / filename,
-        Path(filename)
-    ]
-    
-    for path in possible_paths:
+    for directory in _IMAGE_DIRS:
+        path = directory / filename
         if path.exists():
             return str(path)
     return None
 
 
-def get_base64_image(image_path):
-    """画像をBase64エンコード"""
-    if image_path and os.path.exists(image_path):
-        try:
-            with open(image_path, "rb") as img_file:
-                return base64.b64encode(img_file.read()).decode()
-        except Exception:
-            return None
-    return None
+# カード本体のHTMLテンプレート（起動時に1回だけロードしてPythonコードにコンパイルする）
+_CARD_ENV = Environment(
+    loader=FileSystemLoader(str(Path(__file__).resolve().parent / "templates")),
+    autoescape=True,
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+_CARD_TEMPLATE = _CARD_ENV.get_template("material_card.html.j2")
 
+# 背景テクスチャ（背景画像は使用しないため固定値。起動時に1回だけ確定する）
+_TEXTURE_BG = 'none'
 
-def generate_material_card(card_data: MaterialCard) -> str:
-    """素材カードのHTMLを生成（マテリアル感のあるリッチなデザイン）"""
-    payload = card_data.payload
-    material_id = payload.id
-    material_name = payload.name_official or payload.name
-    material_category = payload.category_main or payload.category
-    material_description = payload.description
-    properties = payload.properties
-    primary_image_path = payload.primary_image_path
-    primary_image_type = payload.primary_image_type
-    primary_image_description = payload.primary_image_description
-    
-    # QRコード生成
-    qr = qrcode.QRCode(version=1, box_size=10, border=5)
-    qr.add_data(f"Material ID: {material_id}")
-    qr.make(fit=True)
-    qr_img = qr.make_image(fill_color="black", back_color="white")
-    
-    # QRコードをBase64エンコード
-    qr_buffer = BytesIO()
-    qr_img.save(qr_buffer, format='PNG')
-    qr_base64 = base64.b64encode(qr_buffer.getvalue()).decode()
-    
-    # 背景画像は使用しない
-    texture_bg = 'none'
-    
-    # 画像パスの処理（参照URL方式に統一）
-    # Materialオブジェクトを取得（payloadから構築、または直接受け取る）
-    # 注意: payloadはPydanticモデルなので、Materialオブジェクトに変換する必要がある
-    # ここでは、payloadの情報からMaterialオブジェクトを模擬的に作成
-    class MaterialProxy:
-        """Materialオブジェクトのプロキシ（payloadから情報を取得）"""
-        def __init__(self, payload):
-            self.id = payload.id
-            self.name_official = getattr(payload, 'name_official', None) or getattr(payload, 'name', None)
-            self.name = getattr(payload, 'name', None)
-            self.texture_image_url = getattr(payload, 'texture_image_url', None)
-            self.texture_image_path = getattr(payload, 'texture_image_path', None) or primary_image_path
-            # use_examplesはpayloadに含まれていない可能性があるので、空リストを返す
-            self.use_examples = []
-    
-    # Materialオブジェクトを取得（実際のMaterialオブジェクトが渡されている場合はそれを使用）
-    material_obj = getattr(card_data, 'material_obj', None)
-    if material_obj is None:
-        # payloadからMaterialProxyを作成（フォールバック）
-        # 注意: material_objがNoneの場合は、DBから引き直すか例外をdebugに出す
-        import warnings
-        warnings.warn(f"card_generator: material_obj is None for material_id={payload.id}, using MaterialProxy")
-        material_obj = MaterialProxy(payload)
-    
-    # get_material_image_ref()を使用して画像srcを取得（primary/space/product）
-    from utils.image_display import get_material_image_ref, to_data_url
-    
-    # primary画像
-    primary_src, primary_debug = get_material_image_ref(material_obj, "primary", project_root=Path.cwd())
-    primary_url = ""
-    if primary_src is None:
-        primary_url = ""
-    elif isinstance(primary_src, str):
-        primary_url = primary_src
-    elif isinstance(primary_src, Path):
-        data_url = to_data_url(primary_src)
-        primary_url = data_url or ""
-    
-    # space画像
-    space_src, space_debug = get_material_image_ref(material_obj, "space", project_root=Path.cwd())
-    space_url = ""
-    if space_src is None:
-        space_url = ""
-    elif isinstance(space_src, str):
-        space_url = space_src
-    elif isinstance(space_src, Path):
-        data_url = to_data_url(space_src)
-        space_url = data_url or ""
-    
-    # product画像
-    product_src, product_debug = get_material_image_ref(material_obj, "product", project_root=Path.cwd())
-    product_url = ""
-    if product_src is None:
-        product_url = ""
-    elif isinstance(product_src, str):
-        product_url = product_src
-    elif isinstance(product_src, Path):
-        data_url = to_data_url(product_src)
-        product_url = data_url or ""
-    
-    # 後方互換性のため、primary_urlをimage_urlとしても使用
-    image_url = primary_url
-    
-    # 主要物性データの取得
-    main_properties = properties[:8] if properties else []
-    
-    # カテゴリに応じたカラー
-    category_colors = {
-        "金属": "#FF6B6B",
-        "プラスチック": "#4ECDC4",
-        "セラミック": "#95E1D3",
-        "複合材料": "#F38181",
-        "その他": "#667eea"
-    }
-    primary_color = category_colors.get(material_category, "#667eea")
-    secondary_color = "#764ba2"
-    
-    # f-string内でバックスラッシュを使うための変数
-    translate_y_up = "translateY(-2px)"
-    translate_y_zero = "translateY(0)"
-    box_shadow_hover = "0 15px 40px rgba(102, 126, 234, 0.4)"
-    box_shadow_normal = "0 10px 30px rgba(102, 126, 234, 0.3)"
-    display_none = "none"
-    display_block = "block"
-    
-    # 画像のonerror属性用のJavaScriptコード
-    if image_url:
-        img_onerror = f'this.style.display="{display_none}"; this.nextElementSibling.style.display="{display_block}";'
-    else:
-        img_onerror = ""
-    
-    # space/product画像用のonerror属性（f-string内でバックスラッシュを使わないように変数に格納）
-    img_onerror_hide = "this.style.display='none';"
-    img_onerror_show = "this.nextElementSibling.style.display='block';"
-    img_onerror_combined = img_onerror_hide + " " + img_onerror_show
-    
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <title>素材カード - {material_name}</title>
-        <style>
-            @media print {{
-                @page {{
+# カードの静的CSS（起動時に1回だけパースし、カテゴリ色とテクスチャのみ差し込む）
+# テクスチャはCSSカスタムプロパティに1回だけ書き、body と .card-container::after から参照する
+_CSS_TEMPLATE = Template("""\
+            :root {
+                --card-texture: $texture_bg;
+            }
+            @media print {
+                @page {
                     size: A4;
                     margin: 15mm;
-                }}
-                body {{
+                }
+                body {
                     background: white;
-                }}
-            }}
-            * {{
+                }
+            }
+            * {
                 margin: 0;
                 padding: 0;
                 box-sizing: border-box;
-            }}
-            body {{
+            }
+            body {
                 font-family: 'Yu Gothic', '游ゴシック', 'Hiragino Sans', 'Meiryo', 'Helvetica Neue', Arial, sans-serif;
                 margin: 0;
                 padding: 30px;
-                background: {texture_bg};
+                background: var(--card-texture);
                 background-size: 300%;
                 background-position: center;
                 background-attachment: fixed;
                 min-height: 100vh;
                 position: relative;
-            }}
-            body::before {{
+            }
+            body::before {
                 content: '';
                 position: fixed;
                 top: 0;
@@ -206,8 +109,8 @@ def generate_material_card(card_data: MaterialCard) -> str:
                 background: linear-gradient(135deg, rgba(102, 126, 234, 0.1) 0%, rgba(118, 75, 162, 0.1) 50%, rgba(240, 147, 251, 0.1) 100%);
                 z-index: 0;
                 pointer-events: none;
-            }}
-            .card-container {{
+            }
+            .card-container {
                 max-width: 900px;
                 margin: 0 auto;
                 background: rgba(255, 255, 255, 0.98);
@@ -220,28 +123,28 @@ def generate_material_card(card_data: MaterialCard) -> str:
                 position: relative;
                 z-index: 1;
                 border: 1px solid rgba(255, 255, 255, 0.8);
-            }}
-            .card-container::after {{
+            }
+            .card-container::after {
                 content: '';
                 position: absolute;
                 top: 0;
                 left: 0;
                 right: 0;
                 bottom: 0;
-                background: {texture_bg};
+                background: var(--card-texture);
                 background-size: 200%;
                 opacity: 0.03;
                 pointer-events: none;
                 mix-blend-mode: multiply;
-            }}
-            .card-header {{
-                background: linear-gradient(135deg, {primary_color} 0%, {secondary_color} 100%);
+            }
+            .card-header {
+                background: linear-gradient(135deg, $primary_color 0%, $secondary_color 100%);
                 color: white;
                 padding: 40px;
                 position: relative;
                 overflow: hidden;
-            }}
-            .card-header::before {{
+            }
+            .card-header::before {
                 content: '';
                 position: absolute;
                 top: -50%;
@@ -250,20 +153,20 @@ def generate_material_card(card_data: MaterialCard) -> str:
                 height: 200%;
                 background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 70%);
                 animation: pulse 3s ease-in-out infinite;
-            }}
-            @keyframes pulse {{
-                0%, 100% {{ opacity: 0.3; }}
-                50% {{ opacity: 0.6; }}
-            }}
-            .material-name {{
+            }
+            @keyframes pulse {
+                0%, 100% { opacity: 0.3; }
+                50% { opacity: 0.6; }
+            }
+            .material-name {
                 font-size: 42px;
                 font-weight: 900;
                 margin: 0 0 15px 0;
                 text-shadow: 0 2px 10px rgba(0, 0, 0, 0.2);
                 position: relative;
                 z-index: 1;
-            }}
-            .category-badge {{
+            }
+            .category-badge {
                 display: inline-block;
                 background: rgba(255, 255, 255, 0.25);
                 backdrop-filter: blur(10px);
@@ -276,26 +179,26 @@ def generate_material_card(card_data: MaterialCard) -> str:
                 border: 2px solid rgba(255, 255, 255, 0.3);
                 position: relative;
                 z-index: 1;
-            }}
-            .card-body {{
+            }
+            .card-body {
                 display: grid;
                 grid-template-columns: 1fr 1fr;
                 gap: 40px;
                 padding: 40px;
                 background: white;
-            }}
-            .image-section {{
+            }
+            .image-section {
                 text-align: center;
                 position: relative;
-            }}
-            .material-image {{
+            }
+            .material-image {
                 max-width: 100%;
                 max-height: 350px;
                 border-radius: 15px;
                 box-shadow: 0 10px 30px rgba(0, 0, 0, 0.15);
                 object-fit: cover;
-            }}
-            .no-image {{
+            }
+            .no-image {
                 background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
                 padding: 120px 20px;
                 border-radius: 15px;
@@ -303,140 +206,141 @@ def generate_material_card(card_data: MaterialCard) -> str:
                 text-align: center;
                 font-size: 16px;
                 border: 2px dashed #ddd;
-            }}
-            .use-examples-section {{
+            }
+            .use-examples-section {
                 grid-column: 1 / -1;
                 margin-top: 20px;
                 padding-top: 30px;
                 border-top: 2px solid #e8e8e8;
-            }}
-            .use-examples-grid {{
+            }
+            .use-examples-grid {
                 display: grid;
                 grid-template-columns: 1fr 1fr;
                 gap: 30px;
                 margin-top: 20px;
-            }}
-            .use-example-item {{
+            }
+            .use-example-item {
                 text-align: center;
-            }}
-            .use-example-item h4 {{
-                color: {primary_color};
+            }
+            .use-example-item h4 {
+                color: $primary_color;
                 font-size: 16px;
                 font-weight: 600;
                 margin-bottom: 15px;
-            }}
-            .use-example-image {{
+            }
+            .use-example-image {
                 max-width: 100%;
                 max-height: 250px;
                 border-radius: 12px;
                 box-shadow: 0 5px 15px rgba(0, 0, 0, 0.1);
                 object-fit: cover;
-            }}
-            .properties-section {{
+            }
+            .properties-section {
                 background: linear-gradient(135deg, #f8f9ff 0%, #ffffff 100%);
                 padding: 30px;
                 border-radius: 20px;
                 border: 2px solid #f0f0f0;
-            }}
-            .properties-section h3 {{
+            }
+            .properties-section h3 {
                 margin-top: 0;
-                color: {primary_color};
+                color: $primary_color;
                 font-size: 24px;
                 font-weight: 700;
-                border-bottom: 3px solid {primary_color};
+                border-bottom: 3px solid $primary_color;
                 padding-bottom: 15px;
                 margin-bottom: 20px;
-            }}
-            .property-item {{
+            }
+            .property-item {
                 display: flex;
                 justify-content: space-between;
                 align-items: center;
                 padding: 15px 0;
                 border-bottom: 1px solid #e8e8e8;
                 transition: all 0.3s ease;
-            }}
-            .property-item:last-child {{
+            }
+            .property-item:last-child {
                 border-bottom: none;
-            }}
-            .property-item:hover {{
+            }
+            .property-item:hover {
                 background: rgba(102, 126, 234, 0.05);
                 padding-left: 10px;
                 border-radius: 8px;
-            }}
-            .property-name {{
+            }
+            .property-name {
                 font-weight: 600;
                 color: #333;
                 font-size: 15px;
-            }}
-            .property-value {{
-                color: {primary_color};
+            }
+            .property-value {
+                color: $primary_color;
                 font-weight: 700;
                 font-size: 16px;
-            }}
-            .description-section {{
+            }
+            .description-section {
                 margin: 0 40px 30px 40px;
                 padding: 30px;
                 background: linear-gradient(135deg, #fff5f5 0%, #ffffff 100%);
                 border-radius: 20px;
-                border-left: 5px solid {primary_color};
-            }}
-            .description-section h3 {{
+                border-left: 5px solid $primary_color;
+            }
+            .description-section h3 {
                 margin-top: 0;
-                color: {primary_color};
+                color: $primary_color;
                 font-size: 22px;
                 font-weight: 700;
                 margin-bottom: 15px;
-            }}
-            .description-section p {{
+            }
+            .description-section p {
                 color: #555;
                 line-height: 1.8;
                 font-size: 15px;
-            }}
-            .card-footer {{
+            }
+            .card-footer {
                 display: flex;
                 justify-content: space-between;
                 align-items: center;
                 padding: 30px 40px;
                 background: #f8f9fa;
                 border-top: 2px solid #e8e8e8;
-            }}
-            .qr-code {{
+            }
+            .qr-code {
                 text-align: center;
                 background: white;
                 padding: 20px;
                 border-radius: 15px;
                 box-shadow: 0 5px 15px rgba(0, 0, 0, 0.1);
-            }}
-            .qr-code img {{
+            }
+            .qr-code svg {
+                display: block;
                 width: 120px;
                 height: 120px;
-            }}
-            .qr-code p {{
+            }
+            .qr-code p {
                 font-size: 11px;
                 color: #999;
                 margin-top: 8px;
-            }}
-            .metadata {{
+            }
+            .metadata {
                 font-size: 13px;
                 color: #666;
-            }}
-            .metadata p {{
+            }
+            .metadata p {
                 margin: 5px 0;
-            }}
-            .material-id {{
+            }
+            .material-id {
                 display: inline-block;
-                background: {primary_color};
+                background: $primary_color;
                 color: white;
                 padding: 8px 15px;
                 border-radius: 20px;
                 font-weight: 600;
                 font-size: 14px;
-            }}
-            .date-info {{
+            }
+            .date-info {
                 color: #999;
                 font-size: 13px;
-            }}
-            .decorative-element {{
+            }
+            .decorative-element {
                 position: absolute;
                 width: 200px;
                 height: 200px;
@@ -444,99 +348,322 @@ def generate_material_card(card_data: MaterialCard) -> str:
                 border-radius: 50%;
                 top: -100px;
                 right: -100px;
-            }}
-            @media (max-width: 768px) {{
-                .card-body {{
+            }
+            @media (max-width: 768px) {
+                .card-body {
                     grid-template-columns: 1fr;
                     gap: 30px;
-                }}
-                .material-name {{
+                }
+                .material-name {
                     font-size: 32px;
-                }}
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="card-container">
-            <div class="card-header">
-                <div class="decorative-element"></div>
-                <h1 class="material-name">{material_name}</h1>
-                {f'<span class="category-badge">{material_category}</span>' if material_category else ''}
-            </div>
-            
-            <div class="card-body">
-                <div class="image-section">
-                    {f'<img src="{image_url}" alt="{material_name}" class="material-image" onerror="{img_onerror}">' if image_url else ''}
-                    {'<div class="no-image" style="display:none;">📷 画像なし</div>' if image_url else '<div class="no-image">📷 画像なし</div>'}
-                </div>
-                
-                <div class="properties-section">
-                    <h3>📊 主要物性</h3>
-                    {''.join([f'''
-                    <div class="property-item">
-                        <span class="property-name">{prop.property_name if hasattr(prop, 'property_name') else '不明'}</span>
-                        <span class="property-value">{prop.value if hasattr(prop, 'value') and prop.value is not None else 'N/A'} {prop.unit if hasattr(prop, 'unit') and prop.unit else ''}</span>
-                    </div>
-                    ''' for prop in main_properties]) if main_properties else '<p style="color: #999; text-align: center; padding: 20px;">物性データが登録されていません</p>'}
-                </div>
-            </div>
-            
-            {(f'''
-            <div class="use-examples-section">
-                <h3 style="color: {primary_color}; font-size: 24px; font-weight: 700; margin-bottom: 20px; border-bottom: 3px solid {primary_color}; padding-bottom: 15px;">📸 使用例</h3>
-                <div class="use-examples-grid">
-                    <div class="use-example-item">
-                        <h4>空間用途</h4>
-                        {f'<img src="{space_url}" alt="空間用途" class="use-example-image" onerror="{img_onerror_combined}">' if space_url else ''}
-                        {'<div class="no-image" style="display:none; padding: 80px 20px; border-radius: 12px; background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%); color: #999; text-align: center; font-size: 14px; border: 2px dashed #ddd;">📷 画像なし</div>' if space_url else '<div class="no-image" style="display:block; padding: 80px 20px; border-radius: 12px; background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%); color: #999; text-align: center; font-size: 14px; border: 2px dashed #ddd;">📷 画像なし</div>'}
-                    </div>
-                    <div class="use-example-item">
-                        <h4>製品用途</h4>
-                        {f'<img src="{product_url}" alt="製品用途" class="use-example-image" onerror="{img_onerror_combined}">' if product_url else ''}
-                        {'<div class="no-image" style="display:none; padding: 80px 20px; border-radius: 12px; background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%); color: #999; text-align: center; font-size: 14px; border: 2px dashed #ddd;">📷 画像なし</div>' if product_url else '<div class="no-image" style="display:block; padding: 80px 20px; border-radius: 12px; background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%); color: #999; text-align: center; font-size: 14px; border: 2px dashed #ddd;">📷 画像なし</div>'}
-                    </div>
-                </div>
-            </div>
-            ''' if (space_url or product_url) else '')}
-            
-            {f'''
-            <div class="description-section">
-                <h3>📝 説明</h3>
-                <p>{material_description or '説明が登録されていません'}</p>
-            </div>
-            ''' if material_description else ''}
-            
-            <div class="card-footer">
-                <div class="metadata">
-                    <p><span class="material-id">ID: {material_id}</span></p>
-                    <p class="date-info">登録日: N/A</p>
-                </div>
-                <div class="qr-code">
-                    <img src="data:image/png;base64,{qr_base64}" alt="QR Code">
-                    <p>詳細情報</p>
-                </div>
-            </div>
-        </div>
-        
-        <div style="text-align: center; margin-top: 30px;">
-            <button onclick="window.print()" style="
-                padding: 15px 40px;
-                font-size: 16px;
-                font-weight: 600;
-                background: linear-gradient(135deg, {primary_color} 0%, {secondary_color} 100%);
-                color: white;
-                border: none;
-                border-radius: 30px;
-                cursor: pointer;
-                box-shadow: {box_shadow_normal};
-                transition: all 0.3s ease;
-            " onmouseover="this.style.transform='{translate_y_up}'; this.style.boxShadow='{box_shadow_hover}';" 
-               onmouseout="this.style.transform='{translate_y_zero}'; this.style.boxShadow='{box_shadow_normal}';">
-                🖨️ 印刷
-            </button>
-        </div>
-    </body>
-    </html>
+                }
+            }""")
+
+
+@lru_cache(maxsize=16)
+def _card_css(primary_color: str) -> str:
+    """
+    カテゴリ色ごとにCSSを展開してキャッシュする
+    
+    CSSで変わるのはカテゴリ色だけ（セカンダリ色とテクスチャは固定）なので、
+    カテゴリ数ぶんの展開済みCSSを使い回し、カードごとの置換を省く。
+    """
+    return _CSS_TEMPLATE.substitute(
+        primary_color=primary_color,
+        secondary_color=_SECONDARY_COLOR,
+        texture_bg=_TEXTURE_BG,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _qr_svg(material_id: int) -> str:
+    """
+    材料IDのQRコードをインラインSVGで返す
+    
+    QR行列から直接SVGのpathを組み立てるため、PILでのラスタライズ・PNGエンコード・
+    Base64を行わない。QRの内容は material_id だけで決まるのでキャッシュする。
+    """
+    # qrcodeは重いので、実際にQRを作るときに初めてimportする
+    import qrcode
+    
+    # "Material ID: <int64>" は最大32バイトなので バージョン2・誤り訂正L に必ず収まる。
+    # バージョンとマスクを固定し、fit/マスク選択（8パターンの減点評価）を省略する
+    qr = qrcode.QRCode(
+        version=2,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        border=4,
+        mask_pattern=0,
+    )
+    qr.add_data(f"Material ID: {material_id}")
+    qr.make(fit=False)
+    matrix = qr.get_matrix()  # 余白（border）込みのbool行列
+    size = len(matrix)
+    
+    # 横方向に連続する黒モジュールを1つの矩形にまとめる
+    segments = []
+    for y, row in enumerate(matrix):
+        x = 0
+        while x < size:
+            if row[x]:
+                start = x
+                while x < size and row[x]:
+                    x += 1
+                segments.append(f"M{start} {y}h{x - start}v1h-{x - start}z")
+            else:
+                x += 1
+    
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {size} {size}" shape-rendering="crispEdges" role="img" aria-label="QR Code">'
+        f'<rect width="{size}" height="{size}" fill="#fff"/>'
+        f'<path d="{"".join(segments)}" fill="#000"/>'
+        '</svg>'
+    )
+
+
+def _static_url(path: Path) -> Optional[str]:
+    """
+    ローカル画像のパスを静的配信用のURL（/static/...）に変換
+    
+    Args:
+        path: 画像ファイルのパス（プロジェクトルート配下）
+    
+    Returns:
+        URL文字列、プロジェクトルート外の場合はNone
+    """
+    try:
+        relative = path.resolve().relative_to(_CWD.resolve())
+    except ValueError:
+        return None
+    return "/" + quote(relative.as_posix())
+
+
+def _resolve_url(material_obj, kind: str, inline_assets: bool = True) -> str:
+    """
+    get_material_image_ref() の結果をカードに埋め込むURLに変換
+    
+    Args:
+        material_obj: Materialオブジェクト（またはMaterialProxy）
+        kind: 画像種別（"primary", "space", "product"）
+        inline_assets: Trueならローカル画像をdata URL、Falseなら /static/... のURLにする
+    
+    Returns:
+        画像URL（画像が無い場合は空文字）
+    """
+    from utils.image_display import get_material_image_ref
+    
+    src, _ = get_material_image_ref(material_obj, kind, project_root=_CWD)
+    return _src_to_url(src, inline_assets)
+
+
+def _src_to_url(src, inline_assets: bool) -> str:
+    """get_material_image_ref() が返したsrc（URL文字列 / Path / None）をURLに変換"""
+    from utils.image_display import to_data_url_fast
+    
+    if src is None:
+        return ""
+    if isinstance(src, str):
+        return src
+    return (to_data_url_fast(src) if inline_assets else _static_url(src)) or ""
+
+
+async def _resolve_url_async(material_obj, kind: str, inline_assets: bool = True) -> str:
+    """
+    _resolve_url の非同期版（ローカル画像の読み込みだけをイベントループに委ねる）
+    
+    Args:
+        material_obj: Materialオブジェクト（またはMaterialProxy）
+        kind: 画像種別（"primary", "space", "product"）
+        inline_assets: Trueならローカル画像をdata URL、Falseなら /static/... のURLにする
+    
+    Returns:
+        画像URL（画像が無い場合は空文字）
+    """
+    from utils.image_display import get_material_image_ref, bytes_to_data_url, to_data_url_fast
+    
+    src, _ = get_material_image_ref(material_obj, kind, project_root=_CWD)
+    if not (inline_assets and isinstance(src, Path)):
+        return _src_to_url(src, inline_assets)
+    
+    if aiofiles is None:
+        # aiofilesが無い環境ではスレッドで読み込む（キャッシュ付きの同期版を流用）
+        return await asyncio.to_thread(to_data_url_fast, src) or ""
+    
+    try:
+        async with aiofiles.open(src, 'rb') as f:
+            img_data = await f.read()
+    except OSError:
+        return ""
+    return bytes_to_data_url(img_data, src.suffix)
+
+
+class MaterialProxy:
+    """
+    Materialオブジェクトのプロキシ（payloadから情報を取得）
+    
+    payloadはPydanticモデルなので、get_material_image_ref() が読む属性だけを
+    Materialオブジェクト風に持たせる。
     """
+    def __init__(self, payload, primary_image_path: Optional[str] = None):
+        self.id = payload.id
+        self.name_official = getattr(payload, 'name_official', None) or getattr(payload, 'name', None)
+        self.name = getattr(payload, 'name', None)
+        self.texture_image_url = getattr(payload, 'texture_image_url', None)
+        self.texture_image_path = getattr(payload, 'texture_image_path', None) or primary_image_path
+        # use_examplesはpayloadに含まれていない可能性があるので、空リストを返す
+        self.use_examples = []
+
+
+def generate_material_card(card_data: MaterialCard, inline_assets: bool = True) -> str:
+    """
+    素材カードのHTMLを生成（マテリアル感のあるリッチなデザイン）
+    
+    Args:
+        card_data: カードデータ
+        inline_assets: Trueならローカル画像をdata URLとして埋め込む（単体HTML・印刷・Streamlit用）。
+            Falseなら /static/... のURLで参照し、読み込みとBase64を省略する（静的配信できるWeb用）
+    
+    Returns:
+        カードのHTML文字列
+    """
+    material_obj = _material_obj_for(card_data)
+    
+    # get_material_image_ref()を使用して画像srcを取得（primary/space/product）
+    primary_url = _resolve_url(material_obj, "primary", inline_assets)
+    space_url = _resolve_url(material_obj, "space", inline_assets)
+    product_url = _resolve_url(material_obj, "product", inline_assets)
+    
+    return _render_card(card_data.payload, primary_url, space_url, product_url)
+
+
+async def generate_material_card_async(card_data: MaterialCard, inline_assets: bool = True) -> str:
+    """
+    素材カードのHTMLを生成（非同期版）
+    
+    primary/space/product の画像を並行して読み込むので、キャッシュが効いていない
+    初回描画でもファイル読み込みの待ち時間が重ならない。FastAPIなど実行中の
+    イベントループ内からはこちらを await する。
+    
+    Args:
+        card_data: カードデータ
+        inline_assets: generate_material_card と同じ
+    
+    Returns:
+        カードのHTML文字列
+    """
+    material_obj = _material_obj_for(card_data)
+    
+    primary_url, space_url, product_url = await asyncio.gather(
+        _resolve_url_async(material_obj, "primary", inline_assets),
+        _resolve_url_async(material_obj, "space", inline_assets),
+        _resolve_url_async(material_obj, "product", inline_assets),
+    )
+    
+    return _render_card(card_data.payload, primary_url, space_url, product_url)
+
+
+def _material_obj_for(card_data: MaterialCard):
+    """画像参照に使うMaterialオブジェクトを取得（実際のMaterialオブジェクトが渡されている場合はそれを使用）"""
+    material_obj = getattr(card_data, 'material_obj', None)
+    if material_obj is None:
+        # payloadからMaterialProxyを作成（フォールバック）
+        # 注意: material_objがNoneの場合は、DBから引き直すか例外をdebugに出す
+        payload = card_data.payload
+        import warnings
+        warnings.warn(f"card_generator: material_obj is None for material_id={payload.id}, using MaterialProxy")
+        material_obj = MaterialProxy(payload, payload.primary_image_path)
+    return material_obj
+
+
+def _render_card(payload, primary_url: str, space_url: str, product_url: str) -> str:
+    """解決済みの画像URLとpayloadからカードHTMLを描画"""
+    return _CARD_TEMPLATE.render(**_card_context(payload, primary_url, space_url, product_url))
+
+
+def _card_context(payload, primary_url: str, space_url: str, product_url: str) -> dict:
+    """カードテンプレートに渡す変数を組み立てる"""
+    material_id = payload.id
+    material_name = payload.name_official or payload.name
+    material_category = payload.category_main or payload.category
+    material_description = payload.description
+    properties = payload.properties
+    
+    # QRコード生成（material_idごとにキャッシュ）
+    qr_svg = _qr_svg(material_id)
+    
+    # 後方互換性のため、primary_urlをimage_urlとしても使用
+    image_url = primary_url
+    
+    # 主要物性データの取得
+    # （スライスでリストをコピーせず、テンプレートのループで先頭8件だけ読む）
+    main_properties = islice(properties or (), 8)
+    
+    # カテゴリに応じたカラー
+    primary_color = _CATEGORY_COLORS.get(material_category, _DEFAULT_PRIMARY)
+    secondary_color = _SECONDARY_COLOR
+    
+    css = _card_css(primary_color)
+    
+    return dict(
+        css=css,
+        material_id=material_id,
+        material_name=material_name,
+        material_category=material_category,
+        material_description=material_description,
+        properties=main_properties,
+        image_url=image_url,
+        space_url=space_url,
+        product_url=product_url,
+        primary_color=primary_color,
+        secondary_color=secondary_color,
+        qr_svg=qr_svg,
+    )
+
+
+def render_many(cards: Iterable[MaterialCard], out: TextIO, inline_assets: bool = True) -> None:
+    """
+    複数の素材カードHTMLを順に out へ書き出す（一括エクスポート用）
+    
+    テンプレートの出力を断片ごとに書き込むので、カード1枚分の文字列も
+    全カードを連結した文字列も作らない。
+    
+    Args:
+        cards: カードデータ（リストでもジェネレータでもよい）
+        out: 書き込み先（StringIO、ファイル、レスポンスボディなど）
+        inline_assets: generate_material_card と同じ
+    """
+    for card_data in cards:
+        material_obj = _material_obj_for(card_data)
+        context = _card_context(
+            card_data.payload,
+            _resolve_url(material_obj, "primary", inline_assets),
+            _resolve_url(material_obj, "space", inline_assets),
+            _resolve_url(material_obj, "product", inline_assets),
+        )
+        out.writelines(_CARD_TEMPLATE.generate(**context))
+
+
+def generate_material_cards(cards: List[MaterialCard], max_workers: Optional[int] = None) -> List[str]:
+    """
+    複数の素材カードHTMLをプロセスプールで並列生成
+    
+    カード生成は材料ごとに独立したCPU処理なので、GILを避けてプロセス単位で分散する。
+    各ワーカーのQR・CSSキャッシュはワーカー内で温まる。
+    
+    Args:
+        cards: カードデータのリスト（ワーカーへpickleで渡すため、material_objは
+            必要な属性をロード済みのもの、またはNoneにしておく）
+        max_workers: ワーカー数（Noneの場合はCPU数）
+    
+    Returns:
+        cardsと同じ順序のHTML文字列のリスト
+    """
+    # 1枚以下ならプロセス起動のコストの方が大きいので直列で生成
+    if len(cards) < 2:
+        return [generate_material_card(card) for card in cards]
+    
+    # 1ワーカーあたり約4チャンクに分け、pickle往復の回数と負荷の偏りを両立させる
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(cards) // (workers * 4))
     
-    return html
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(generate_material_card, cards, chunksize=chunksize))
@@ -1,26 +1,117 @@
 """
 データベース設定とモデル定義（詳細仕様対応版）
 """
-from sqlalchemy import create_engine, Column, Integer, String, Float, Text, DateTime, ForeignKey, Boolean, UniqueConstraint, Index, text
+from sqlalchemy import create_engine, event, func, select, Column, Integer, String, Float, Numeric, Text, DateTime, ForeignKey, Boolean, UniqueConstraint, Index, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
-from datetime import datetime
+from sqlalchemy.orm import sessionmaker, relationship, selectinload
+from functools import cached_property
+from typing import Optional
 import json
+import os
+
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError は json.JSONDecodeError のサブクラス
+except ImportError:
+    _json_loads = json.loads
 
 # SQLiteデータベースの作成
 SQLALCHEMY_DATABASE_URL = "sqlite:///./materials.db"
 
+# スキーマ版（PRAGMA user_version に記録）。モデルのカラム・インデックスを変更したら上げる
+SCHEMA_VERSION = 6
+
+# 接続プール設定（Streamlitはセッションごとのスレッドから並行にSessionLocal()を開くため明示的に確保）
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=10,
+    max_overflow=20,
+    pool_recycle=1800,
+    pool_use_lifo=True,  # よく使う接続を再利用して作業セットを小さく保つ
+    # SQLiteはローカルファイルのため切断検知（pre_ping）は不要
+    pool_pre_ping=not SQLALCHEMY_DATABASE_URL.startswith("sqlite"),
+)
+
+
+# SQLiteの接続ごとのPRAGMA（WALで読み取りと書き込みを並行させ、fsyncとページキャッシュを調整）
+_SQLITE_PRAGMAS = (
+    "busy_timeout=10000",  # 最初に設定し、WAL切り替え時のロック競合も10秒まで待つ
+    "journal_mode=WAL",
+    "synchronous=NORMAL",  # WALではNORMALでもコミット済みデータは壊れない
+    "cache_size=-65536",  # 64MB
+    "mmap_size=268435456",  # 256MB
+    "temp_store=MEMORY",
+    "wal_autocheckpoint=1000",  # 1000ページごとにWALをDB本体へ書き戻し、WALファイルの肥大化を防ぐ
 )
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """SQLite接続の確立時にPRAGMAを設定"""
+    if not SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+    finally:
+        cursor.close()
+
+
+@event.listens_for(engine, "close")
+def _optimize_sqlite_on_close(dbapi_connection, connection_record):
+    """SQLite接続を閉じる前に PRAGMA optimize でクエリプランナの統計を更新"""
+    if not SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA analysis_limit=400")  # 統計の収集を表ごとに400行までに抑える
+        cursor.execute("PRAGMA optimize")
+    except Exception:
+        pass  # 閉じる処理を妨げない
+    finally:
+        cursor.close()
+
+
+# 書き込み専用エンジン（SQLiteは同時に1つしか書けないため、接続1本に絞って
+# 書き込み同士はプール内で順番待ちさせ、読み取り用の接続をロック待ちで塞がない）
+write_engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=1,
+    max_overflow=0,
+    pool_timeout=30,
+    pool_recycle=1800,
+    pool_pre_ping=not SQLALCHEMY_DATABASE_URL.startswith("sqlite"),
+)
+event.listen(write_engine, "connect", _set_sqlite_pragmas)
+event.listen(write_engine, "close", _optimize_sqlite_on_close)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+WriteSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=write_engine)
 
 Base = declarative_base()
 
+# Materialの子テーブルの読み込み方法。DB_RAISE_LAZY=1 で遅延ロードを例外にし、
+# selectinload の付け忘れ（N+1クエリ）を開発時に検出する
+_CHILD_LAZY = "raise" if os.getenv("DB_RAISE_LAZY", "0") == "1" else "select"
+
 
 class Material(Base):
     """材料テーブル（詳細仕様対応）"""
     __tablename__ = "materials"
+    __table_args__ = (
+        # 一覧の条件（is_deleted=0 AND is_published=1）に合う行だけの部分インデックス。
+        # created_at 降順の並びもインデックス順で返し、一覧に出す名称も含めて
+        # 選択肢の取得（get_material_options）をテーブル本体を読まずに済ませる
+        # （SQLiteは部分インデックスの条件列もインデックスに無いとカバリング扱いにしない）
+        Index(
+            'ix_materials_pub_listing', 'created_at', 'name_official', 'name', 'is_deleted', 'is_published',
+            sqlite_where=text('is_deleted = 0 AND is_published = 1'),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     uuid = Column(String(36), unique=True, index=True)  # UUID
@@ -129,20 +220,20 @@ class Material(Base):
     category = Column(String(100), index=True)  # 旧category（後方互換）
     description = Column(Text)  # 旧description（後方互換）
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
 
     # 画像パス（生成物）
     texture_image_path = Column(String(500))  # テクスチャ画像パス（相対パス、後方互換）
     texture_image_url = Column(String(1000))  # テクスチャ画像URL（S3 URL、新規追加）
     
     # リレーション
-    properties = relationship("Property", back_populates="material", cascade="all, delete-orphan")
-    images = relationship("Image", back_populates="material", cascade="all, delete-orphan")
-    metadata_items = relationship("MaterialMetadata", back_populates="material", cascade="all, delete-orphan")
-    reference_urls = relationship("ReferenceURL", back_populates="material", cascade="all, delete-orphan")
-    use_examples = relationship("UseExample", back_populates="material", cascade="all, delete-orphan")
-    process_example_images = relationship("ProcessExampleImage", back_populates="material", cascade="all, delete-orphan")
+    properties = relationship("Property", back_populates="material", cascade="all, delete-orphan", lazy=_CHILD_LAZY)
+    images = relationship("Image", back_populates="material", cascade="all, delete-orphan", lazy=_CHILD_LAZY)
+    metadata_items = relationship("MaterialMetadata", back_populates="material", cascade="all, delete-orphan", lazy=_CHILD_LAZY)
+    reference_urls = relationship("ReferenceURL", back_populates="material", cascade="all, delete-orphan", lazy=_CHILD_LAZY)
+    use_examples = relationship("UseExample", back_populates="material", cascade="all, delete-orphan", lazy=_CHILD_LAZY)
+    process_example_images = relationship("ProcessExampleImage", back_populates="material", cascade="all, delete-orphan", lazy=_CHILD_LAZY)
 
 
 class MaterialSubmission(Base):
@@ -151,8 +242,8 @@ class MaterialSubmission(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     uuid = Column(String(36), unique=True, index=True)  # UUID
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
     
     # ステータス: pending/approved/rejected
     status = Column(String(20), nullable=False, default="pending")  # pending, approved, rejected
@@ -170,6 +261,11 @@ class MaterialSubmission(Base):
     # 承認時に作成された材料ID（承認後の参照用）
     approved_material_id = Column(Integer, ForeignKey("materials.id"), nullable=True)
 
+    @cached_property
+    def payload(self) -> dict:
+        """payload_jsonをパースした辞書（インスタンスごとに1回だけパースして共有）"""
+        return _json_loads(self.payload_json)
+
 
 class Property(Base):
     """物性テーブル"""
@@ -193,6 +289,10 @@ class Property(Base):
 class Image(Base):
     """画像テーブル"""
     __tablename__ = "images"
+    __table_args__ = (
+        # material_id + image_type の複合インデックス（主画像・用途別画像の参照を高速化）
+        Index('ix_images_mid_type', 'material_id', 'image_type'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     material_id = Column(Integer, ForeignKey("materials.id"), nullable=False)
@@ -278,41 +378,151 @@ class ProcessExampleImage(Base):
     material = relationship("Material", back_populates="process_example_images")
 
 
+class MaterialElement(Base):
+    """
+    材料×元素の対応テーブル（Material.main_elements の展開）
+    
+    「元素Xを含む材料」をJSONの全件パースではなくインデックスで引くためのもの。
+    行はSQLiteのトリガーが main_elements から自動で作るので、アプリ側では書き込まない。
+    """
+    __tablename__ = "material_elements"
+    __table_args__ = (
+        UniqueConstraint('material_id', 'atomic_number', name='uq_material_element'),
+        # 元素 → 材料 の逆引き用
+        Index('ix_mat_elem_rev', 'atomic_number', 'material_id'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    material_id = Column(Integer, ForeignKey("materials.id"), nullable=False)
+    atomic_number = Column(Integer, nullable=False)
+
+
+# main_elements（原子番号のJSON配列）から material_elements を作り直すSQL（{material_id} と {main_elements} を差し替えて使う）
+_MATERIAL_ELEMENTS_FILL_SQL = """
+    INSERT OR IGNORE INTO material_elements (material_id, atomic_number)
+    SELECT {material_id}, CAST(j.value AS INTEGER)
+    FROM json_each(CASE WHEN json_valid({main_elements}) THEN {main_elements} ELSE '[]' END) AS j
+    WHERE j.type IN ('integer', 'text') AND CAST(j.value AS INTEGER) > 0
+"""
+
+# 既存の全材料から material_elements を埋めるSQL
+_MATERIAL_ELEMENTS_BACKFILL_SQL = """
+    INSERT OR IGNORE INTO material_elements (material_id, atomic_number)
+    SELECT m.id, CAST(j.value AS INTEGER)
+    FROM materials AS m,
+         json_each(CASE WHEN json_valid(m.main_elements) THEN m.main_elements ELSE '[]' END) AS j
+    WHERE j.type IN ('integer', 'text') AND CAST(j.value AS INTEGER) > 0
+"""
+
+# 既存テーブルに追加するインデックス（モデル側の UniqueConstraint / Index と同じ定義）
+_INDEX_SQL = (
+    # 一意インデックス（SQLiteでは制約として機能）
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_material_name_official ON materials(name_official)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_property_material_name ON properties(material_id, property_name)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_use_example_material_name ON use_examples(material_id, example_name)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_metadata_material_key ON material_metadata(material_id, key)",
+    # 旧版の一覧用インデックスはカバリング部分インデックスに置き換える
+    "DROP INDEX IF EXISTS ix_materials_live_created",
+    "DROP INDEX IF EXISTS ix_materials_pub_created",
+    "CREATE INDEX IF NOT EXISTS ix_materials_pub_listing ON materials(created_at, name_official, name, is_deleted, is_published) WHERE is_deleted = 0 AND is_published = 1",
+    "CREATE INDEX IF NOT EXISTS ix_images_mid_type ON images(material_id, image_type)",
+)
+
+# materials の書き込みに追従して material_elements を保つトリガー
+_MATERIAL_ELEMENTS_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_material_elements_ai AFTER INSERT ON materials BEGIN
+        {_MATERIAL_ELEMENTS_FILL_SQL.format(material_id="new.id", main_elements="new.main_elements")};
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_material_elements_au AFTER UPDATE OF main_elements ON materials BEGIN
+        DELETE FROM material_elements WHERE material_id = old.id;
+        {_MATERIAL_ELEMENTS_FILL_SQL.format(material_id="new.id", main_elements="new.main_elements")};
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_material_elements_ad AFTER DELETE ON materials BEGIN
+        DELETE FROM material_elements WHERE material_id = old.id;
+    END
+    """,
+)
+
+
+# 材料検索用のFTS5全文検索インデックス（materials を外部コンテンツとして参照し、本文は複製しない）。
+# 日本語は単語区切りが無いため trigram トークナイザで部分一致検索にする（大文字小文字は区別しない）
+_MATERIALS_FTS_SQL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS materials_fts USING fts5(
+        name, category, description,
+        content='materials', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_materials_fts_ai AFTER INSERT ON materials BEGIN
+        INSERT INTO materials_fts (rowid, name, category, description)
+        VALUES (new.id, new.name, new.category, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_materials_fts_ad AFTER DELETE ON materials BEGIN
+        INSERT INTO materials_fts (materials_fts, rowid, name, category, description)
+        VALUES ('delete', old.id, old.name, old.category, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_materials_fts_au AFTER UPDATE OF name, category, description ON materials BEGIN
+        INSERT INTO materials_fts (materials_fts, rowid, name, category, description)
+        VALUES ('delete', old.id, old.name, old.category, old.description);
+        INSERT INTO materials_fts (rowid, name, category, description)
+        VALUES (new.id, new.name, new.category, new.description);
+    END
+    """,
+)
+
+
 # データベーステーブルの作成
-def _sqlite_ensure_columns(db_path: str, table: str, required: dict[str, str]) -> list[str]:
+def _sqlite_ensure_columns(cursor, table: str, required: dict[str, str], existing: Optional[set] = None) -> list[str]:
     """
     SQLiteテーブルに不足カラムを自動追加
     
+    コミットは行わないので、呼び出し側のトランザクション内でまとめて確定させる。
+    
     Args:
-        db_path: データベースファイルのパス
+        cursor: sqlite3のカーソル
         table: テーブル名
         required: {column_name: sqlite_type_sql} の辞書
                  例: {"main_elements": "TEXT"}
+        existing: 既存の列名（取得済みなら渡す。Noneの場合は PRAGMA table_info で取得）
     
     Returns:
         追加されたカラム名のリスト
     """
-    import sqlite3
-    
-    con = sqlite3.connect(db_path)
-    cur = con.cursor()
-    cur.execute(f"PRAGMA table_info({table})")
-    existing = {row[1] for row in cur.fetchall()}  # row[1] = column name
+    if existing is None:
+        cursor.execute(f"PRAGMA table_info({table})")
+        existing = {row[1] for row in cursor.fetchall()}  # row[1] = column name
     
     added = []
     for col, coltype in required.items():
         if col not in existing:
             try:
-                cur.execute(f"ALTER TABLE {table} ADD COLUMN {col} {coltype}")
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {col} {coltype}")
                 added.append(col)
             except Exception as e:
                 print(f"Warning: Failed to add column {col} to {table}: {e}")
     
-    con.commit()
-    con.close()
     return added
 
 
+# SQLAlchemyの型 → SQLite型（該当しない型は TEXT）
+_SQLITE_TYPE_MAP = {
+    Integer: "INTEGER",
+    Boolean: "INTEGER",
+    Float: "REAL",  # SQLAlchemy 2.1 以降、Float は Numeric のサブクラスではない
+    Numeric: "REAL",
+}
+
+
 def _sqlite_type_from_sqlalchemy_type(col_type) -> str:
     """
     SQLAlchemyの型をSQLite型に変換
@@ -323,23 +533,24 @@ def _sqlite_type_from_sqlalchemy_type(col_type) -> str:
     Returns:
         SQLite型文字列（INTEGER, REAL, TEXT）
     """
-    type_name = str(col_type)
-    
-    if "Integer" in type_name or "Boolean" in type_name:
-        return "INTEGER"
-    elif "Float" in type_name or "Numeric" in type_name:
-        return "REAL"
-    else:
-        # String, Text, DateTime, JSON等は全てTEXT
-        return "TEXT"
+    # 型クラスの継承順にたどって最初に見つかった対応を使う
+    for cls in type(col_type).__mro__:
+        sqlite_type = _SQLITE_TYPE_MAP.get(cls)
+        if sqlite_type is not None:
+            return sqlite_type
+    # String, Text, DateTime, JSON等は全てTEXT
+    return "TEXT"
 
 
-def migrate_sqlite_schema_if_needed(engine) -> None:
+def migrate_sqlite_schema_if_needed(engine) -> bool:
     """
     SQLite DBのスキーマをSQLAlchemyモデルに合わせて自動補完（全テーブルの不足カラムを全部追加）
     
     Args:
         engine: SQLAlchemyエンジン
+    
+    Returns:
+        すべてのテーブルを処理できた場合True（失敗したテーブルがあればFalse）
     """
     from pathlib import Path
     import sqlite3
@@ -351,22 +562,36 @@ def migrate_sqlite_schema_if_needed(engine) -> None:
     
     # DBが無ければ create_all が作るのでここでは何もしない
     if not p.exists():
-        return
+        return True
     
     # SQLiteでない場合はスキップ
     if engine.url.get_backend_name() != "sqlite":
-        return
+        return True
     
+    ok = True    
     try:
         conn = sqlite3.connect(str(p))
         cursor = conn.cursor()
+        # 全テーブルのALTERを1トランザクションにまとめる（書き込みロックの取得とコミットは1回）。
+        # IMMEDIATE で最初にロックを取り、途中で読み取り→書き込みへの昇格待ち（SQLITE_BUSY）にならないようにする
+        cursor.execute("BEGIN IMMEDIATE")
+        
+        # 全テーブルの既存列名を1回のクエリで取得（テーブルごとの PRAGMA table_info を発行しない）
+        cursor.execute(
+            "SELECT m.name, p.name FROM sqlite_master AS m "
+            "JOIN pragma_table_info(m.name) AS p WHERE m.type = 'table'"
+        )
+        existing_by_table = {}
+        for table_name, col_name in cursor.fetchall():
+            existing_by_table.setdefault(table_name, set()).add(col_name)
         
         # Base.metadata.tables に含まれる全テーブルを走査
         for table_name, table in Base.metadata.tables.items():
+            if table_name not in existing_by_table:
+                # テーブル自体が無い場合は create_all が作るので対象外
+                continue
             try:
-                # PRAGMA table_info(<table>) で既存列名を取得
-                cursor.execute(f"PRAGMA table_info({table_name})")
-                existing_columns = {row[1] for row in cursor.fetchall()}  # row[1] = column name
+                existing_columns = existing_by_table[table_name]
                 
                 # SQLAlchemy側に存在する列で、SQLite側に無いものを列挙
                 missing_columns = {}
@@ -378,20 +603,25 @@ def migrate_sqlite_schema_if_needed(engine) -> None:
                 
                 # 不足カラムを追加
                 if missing_columns:
-                    added = _sqlite_ensure_columns(str(p), table_name, missing_columns)
+                    added = _sqlite_ensure_columns(cursor, table_name, missing_columns, existing_columns)
                     if added:
                         for col_name in added:
                             col_type = missing_columns[col_name]
                             print(f"[DB MIGRATE] {table_name}: add column {col_name} {col_type}")
+                    if len(added) < len(missing_columns):
+                        # 追加に失敗したカラムがある（user_versionを更新せず次回起動で再試行する）
+                        ok = False
                 else:
                     print(f"[DB MIGRATE] {table_name}: No missing columns found")
                     
             except Exception as e:
                 # テーブル単位のエラーはログして継続（他のテーブルは処理を続ける）
                 print(f"[DB MIGRATE] {table_name}: Failed to migrate: {e}")
+                ok = False
                 import traceback
                 traceback.print_exc()
         
+        conn.commit()
         conn.close()
             
     except Exception as e:
@@ -399,6 +629,9 @@ def migrate_sqlite_schema_if_needed(engine) -> None:
         print(f"[DB MIGRATION] Failed: {e}")
         import traceback
         traceback.print_exc()
+        ok = False
+    
+    return ok
 
 
 def init_db():
@@ -423,18 +656,27 @@ def init_db():
     注意: 一意制約は既存テーブルに追加できない場合がある（SQLite制限）ため、
           アプリ側のロジックでも二重ガードを実装
     """
+    is_sqlite = engine.url.get_backend_name() == "sqlite"
+    
+    # 前回の起動でこのスキーマ版まで移行済みなら、テーブル・カラム・インデックスの確認を丸ごと省略
+    if is_sqlite:
+        with engine.connect() as conn:
+            if conn.execute(text("PRAGMA user_version")).scalar() == SCHEMA_VERSION:
+                return
+    
+    schema_ok = True
+    
     # 既存のDBがあっても create_all は無害（足りないテーブルだけ作る）
     Base.metadata.create_all(bind=engine)
     
     # SQLiteの不足カラム補完（今回のコア修正）
-    if engine.url.get_backend_name() == "sqlite":
+    if is_sqlite:
         try:
-            migrate_sqlite_schema_if_needed(engine)
+            schema_ok = migrate_sqlite_schema_if_needed(engine)
             
             # 既存データにis_published=1を設定（後方互換）
             try:
                 with engine.begin() as conn:
-                    from sqlalchemy import text
                     # is_publishedカラムが存在する場合、NULLのレコードに1を設定
                     conn.execute(text("UPDATE materials SET is_published = 1 WHERE is_published IS NULL"))
             except Exception as e:
@@ -443,7 +685,6 @@ def init_db():
             # 必須フィールドの空文字修正（既存DBの空文字をデフォルト値で埋める）
             try:
                 with engine.begin() as conn:
-                    from sqlalchemy import text
                     # prototyping_difficulty が NULL または空文字列の場合、"中" に補完
                     result1 = conn.execute(text("""
                         UPDATE materials
@@ -464,17 +705,8 @@ def init_db():
                     """))
                     print(f"[DB MIGRATION] Fixed empty required fields: prototyping_difficulty={result1.rowcount}, equipment_level={result2.rowcount}, visibility={result3.rowcount}")
                     
-                    # is_deleted/deleted_atカラムの追加と既存行の初期化
+                    # 既存行の初期化（is_deleted/deleted_at カラム自体は migrate_sqlite_schema_if_needed が追加済み）
                     try:
-                        from sqlalchemy import inspect
-                        inspector = inspect(engine)
-                        columns = [col['name'] for col in inspector.get_columns('materials')]
-                        if 'is_deleted' not in columns:
-                            conn.execute(text("ALTER TABLE materials ADD COLUMN is_deleted INTEGER NOT NULL DEFAULT 0"))
-                            print("[DB MIGRATION] Added is_deleted column to materials")
-                        if 'deleted_at' not in columns:
-                            conn.execute(text("ALTER TABLE materials ADD COLUMN deleted_at DATETIME"))
-                            print("[DB MIGRATION] Added deleted_at column to materials")
                         # 既存行をis_deleted=0で埋める
                         result4 = conn.execute(text("UPDATE materials SET is_deleted = 0 WHERE is_deleted IS NULL"))
                         print(f"[DB MIGRATION] Initialized is_deleted: {result4.rowcount} rows")
@@ -487,139 +719,207 @@ def init_db():
             print(f"[DB MIGRATION] Error in migrate_sqlite_schema_if_needed: {e}")
             import traceback
             traceback.print_exc()
+            schema_ok = False
     
-    # 既存データベースへのカラム追加（安全にALTER）
+    # 既存データベースへのインデックス追加（不足カラムは migrate_sqlite_schema_if_needed で追加済み）
     try:
-        from sqlalchemy import inspect, text
-        inspector = inspect(engine)
+        # create_all は既存テーブルにインデックスを追加しないため、1本の接続でまとめて作成する。
+        # IF NOT EXISTS なので事前の存在確認は不要。一意インデックスは既存データの重複で
+        # 失敗しうる（SQLite制限）ため、文ごとに失敗を無視して残りを続行（アプリ側のロジックで二重ガード）
+        with engine.connect() as conn:
+            for index_sql in _INDEX_SQL:
+                try:
+                    conn.execute(text(index_sql))
+                except Exception as e:
+                    print(f"インデックスの追加をスキップしました: {e}")
+                    schema_ok = False  # 重複を解消した後の起動で再試行する
+            conn.commit()
+        
+        # material_elements の同期トリガーと既存データの展開（トリガー作成前の行を1回だけ埋める）
+        with engine.begin() as conn:
+            for trigger_sql in _MATERIAL_ELEMENTS_TRIGGERS:
+                conn.execute(text(trigger_sql))
+            conn.execute(text("DELETE FROM material_elements"))
+            conn.execute(text(_MATERIAL_ELEMENTS_BACKFILL_SQL))
         
-        # 一意制約の追加（既存テーブルに追加を試みる、失敗しても続行）
-        # SQLiteでは既存テーブルへの一意制約追加が難しいため、エラーは無視
+        # 全文検索インデックスとトリガーを作成し、既存行から索引を作り直す
         try:
-            if 'materials' in inspector.get_table_names():
-                existing_indexes = [idx['name'] for idx in inspector.get_indexes('materials')]
-                if 'uq_material_name_official' not in existing_indexes:
-                    # 一意インデックスを作成（SQLiteでは制約として機能）
-                    with engine.connect() as conn:
-                        try:
-                            conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS uq_material_name_official ON materials(name_official)"))
-                            conn.commit()
-                        except Exception:
-                            pass  # 既に存在するか、制約追加が失敗した場合は無視
-            
-            if 'properties' in inspector.get_table_names():
-                existing_indexes = [idx['name'] for idx in inspector.get_indexes('properties')]
-                if 'uq_property_material_name' not in existing_indexes:
-                    with engine.connect() as conn:
-                        try:
-                            conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS uq_property_material_name ON properties(material_id, property_name)"))
-                            conn.commit()
-                        except Exception:
-                            pass
-            
-            if 'use_examples' in inspector.get_table_names():
-                existing_indexes = [idx['name'] for idx in inspector.get_indexes('use_examples')]
-                if 'uq_use_example_material_name' not in existing_indexes:
-                    with engine.connect() as conn:
-                        try:
-                            conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS uq_use_example_material_name ON use_examples(material_id, example_name)"))
-                            conn.commit()
-                        except Exception:
-                            pass
-            
-            if 'material_metadata' in inspector.get_table_names():
-                existing_indexes = [idx['name'] for idx in inspector.get_indexes('material_metadata')]
-                if 'uq_metadata_material_key' not in existing_indexes:
-                    with engine.connect() as conn:
-                        try:
-                            conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS uq_metadata_material_key ON material_metadata(material_id, key)"))
-                            conn.commit()
-                        except Exception:
-                            pass
+            with engine.begin() as conn:
+                for fts_sql in _MATERIALS_FTS_SQL:
+                    conn.execute(text(fts_sql))
+                conn.execute(text("INSERT INTO materials_fts (materials_fts) VALUES ('rebuild')"))
         except Exception as e:
-            # 一意制約の追加に失敗しても続行（アプリ側のロジックで二重ガード）
-            print(f"一意制約の追加をスキップしました（既存テーブルの場合、SQLite制限により追加できない場合があります）: {e}")
-        
-        # materials テーブルのカラム確認
-        if 'materials' in inspector.get_table_names():
-            existing_columns = [col['name'] for col in inspector.get_columns('materials')]
-            
-            # texture_image_pathカラムが存在しない場合は追加
-            if 'texture_image_path' not in existing_columns:
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE materials ADD COLUMN texture_image_path VARCHAR(500)"))
-                    conn.commit()
-                print("✓ texture_image_pathカラムを追加しました")
-            
-            # texture_image_urlカラムが存在しない場合は追加
-            if 'texture_image_url' not in existing_columns:
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE materials ADD COLUMN texture_image_url VARCHAR(1000)"))
-                    conn.commit()
-                print("✓ texture_image_urlカラムを追加しました")
-        
-        # images テーブルのカラム確認
-        if 'images' in inspector.get_table_names():
-            existing_columns = [col['name'] for col in inspector.get_columns('images')]
-            
-            # urlカラムが存在しない場合は追加
-            if 'url' not in existing_columns:
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE images ADD COLUMN url VARCHAR(1000)"))
-                    conn.commit()
-                print("✓ images.urlカラムを追加しました")
-            
-            # file_pathをnullableに変更（既存データは保持）
-            # SQLiteではALTER COLUMNが直接できないため、新しいテーブルを作成して移行する必要がある
-            # ただし、既存データに影響を与えないため、ここではカラム追加のみ行う
-            # file_pathのnullable変更は、既存データが存在する場合は手動で行うか、移行スクリプトで対応
-        
-        # use_examples テーブルのカラム確認
-        if 'use_examples' in inspector.get_table_names():
-            existing_columns = [col['name'] for col in inspector.get_columns('use_examples')]
-            
-            # image_urlカラムが存在しない場合は追加
-            if 'image_url' not in existing_columns:
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE use_examples ADD COLUMN image_url VARCHAR(1000)"))
-                    conn.commit()
-                print("✓ use_examples.image_urlカラムを追加しました")
-        
-        # process_example_images テーブルのカラム確認
-        if 'process_example_images' in inspector.get_table_names():
-            existing_columns = [col['name'] for col in inspector.get_columns('process_example_images')]
-            
-            # image_urlカラムが存在しない場合は追加
-            if 'image_url' not in existing_columns:
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE process_example_images ADD COLUMN image_url VARCHAR(1000)"))
-                    conn.commit()
-                print("✓ process_example_images.image_urlカラムを追加しました")
-            
-            # image_pathをnullableに変更（既存データは保持）
-            # SQLiteではALTER COLUMNが直接できないため、新しいテーブルを作成して移行する必要がある
-            # ただし、既存データに影響を与えないため、ここではカラム追加のみ行う
-        
-        # material_submissions テーブルのカラム確認
-        if 'material_submissions' in inspector.get_table_names():
-            existing_columns = [col['name'] for col in inspector.get_columns('material_submissions')]
-            
-            # approved_material_idカラムが存在しない場合は追加
-            if 'approved_material_id' not in existing_columns:
-                with engine.begin() as conn:
-                    conn.execute(text("ALTER TABLE material_submissions ADD COLUMN approved_material_id INTEGER"))
-                    print("[DB MIGRATION] Added approved_material_id column to material_submissions")
+            # FTS5が無いSQLiteでも起動は続ける（検索は部分一致にフォールバック）
+            print(f"[DB MIGRATION] Skipped materials_fts: {e}")
         
     except Exception as e:
         # 既に存在するか、その他のエラー（無視して続行）
         print(f"スキーマ拡張チェック: {e}")
+        schema_ok = False
+    
+    # すべて成功した場合だけスキーマ版を記録（失敗があれば次回の起動で再試行する）
+    if is_sqlite and schema_ok:
+        with engine.begin() as conn:
+            conn.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
 
 
-# データベースセッションの依存性注入用
-def get_db():
-    db = SessionLocal()
+def _session_scope(session_factory):
+    """
+    リクエスト単位のセッション（正常終了でまとめてコミット、例外ならロールバック）
+    
+    ルート内の書き込みは1トランザクションにまとまり、コミット（fsync）はリクエストごとに1回になる。
+    """
+    db = session_factory()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
 
+
+# データベースセッションの依存性注入用
+def get_db():
+    yield from _session_scope(SessionLocal)
+
+
+# 書き込みを行うAPI用（単一接続の write_engine を使う）。接続待ちでイベントループを
+# 止めないよう、このセッションを使うルートは async def ではなく def で定義する
+def get_db_write():
+    yield from _session_scope(WriteSessionLocal)
+
+
+
+def bulk_insert(db, model, rows: list[dict], conflict_cols: list[str], update: bool = True) -> None:
+    """
+    複数行を1つの INSERT ... VALUES (...), (...) ON CONFLICT 文でまとめて書き込む
+    
+    ORMの db.add() を行数分繰り返すと1行ずつINSERTが発行されるため、
+    シード投入・インポートなどの大量書き込みではこちらを使う。
+    
+    Args:
+        db: データベースセッション（コミットは呼び出し側で行う）
+        model: 書き込み先のモデルクラス（例: Property）
+        rows: 行の辞書のリスト（すべて同じキーを持つこと）
+        conflict_cols: 一意制約の列（例: ["material_id", "property_name"]）
+        update: Trueなら衝突した行を rows の値で更新、Falseなら既存行を残す
+    """
+    if not rows:
+        return
+    
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+    
+    stmt = sqlite_insert(model.__table__).values(rows)
+    update_cols = [col for col in rows[0] if col not in conflict_cols]
+    if update and update_cols:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=conflict_cols,
+            set_={col: stmt.excluded[col] for col in update_cols},
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=conflict_cols)
+    db.execute(stmt)
+
+
+def write_material_bundle(db, material_values: dict, properties: list[dict], metadata: list[dict]) -> int:
+    """
+    材料1件と子テーブル（物性・メタデータ）を最小の文数で書き込む
+    
+    材料は INSERT ... RETURNING id の1文、子テーブルはそれぞれ
+    INSERT ... VALUES (...), (...) の複数行1文にまとめる（ORMでは行ごとにINSERTが発行される）。
+    
+    Args:
+        db: データベースセッション（コミットは呼び出し側で行う）
+        material_values: materials テーブルの列名→値
+        properties: properties テーブルの行の辞書のリスト（material_id は不要）
+        metadata: material_metadata テーブルの行の辞書のリスト（material_id は不要）
+    
+    Returns:
+        作成した材料のID
+    """
+    from sqlalchemy import insert
+    
+    material_id = db.execute(
+        insert(Material.__table__).values(**material_values).returning(Material.__table__.c.id)
+    ).scalar_one()
+    
+    for model, rows in ((Property, properties), (MaterialMetadata, metadata)):
+        if rows:
+            db.execute(insert(model.__table__).values([{**row, "material_id": material_id} for row in rows]))
+    
+    return material_id
+
+
+def search_material_ids(db, query: str) -> Optional[set]:
+    """
+    材料名・カテゴリ・説明の部分一致検索を全文検索インデックス（materials_fts）で行う
+    
+    Args:
+        db: データベースセッション
+        query: 検索キーワード
+    
+    Returns:
+        一致した材料IDの集合。trigramで引けない3文字未満のキーワードや、
+        FTS5が使えない環境ではNone（呼び出し側で部分一致にフォールバック）
+    """
+    keyword = query.strip()
+    if len(keyword) < 3:
+        return None
+    
+    # キーワード全体を1つのフレーズとして扱う（FTS5の演算子として解釈させない）
+    phrase = '"' + keyword.replace('"', '""') + '"'
+    try:
+        rows = db.execute(
+            text("SELECT rowid FROM materials_fts WHERE materials_fts MATCH :phrase"),
+            {"phrase": phrase},
+        )
+    except OperationalError:
+        return None
+    return set(rows.scalars())
+
+
+def get_material_ids_by_element(db, atomic_number: int) -> list[int]:
+    """
+    指定した元素を主要元素に含む材料のIDを取得（material_elements のインデックスで引く）
+    
+    Args:
+        db: データベースセッション
+        atomic_number: 原子番号
+    
+    Returns:
+        材料IDのリスト（昇順）
+    """
+    rows = db.execute(
+        select(MaterialElement.material_id)
+        .where(MaterialElement.atomic_number == atomic_number)
+        .order_by(MaterialElement.material_id)
+    )
+    return list(rows.scalars())
+
+
+def get_material_full(db, material_id: int):
+    """
+    カード生成に使う子テーブルをまとめてロードした材料を取得
+    
+    properties / images / metadata_items / use_examples を selectinload で先読みし、
+    カード生成中の遅延ロード（N+1クエリ）を避ける。
+    
+    Args:
+        db: データベースセッション
+        material_id: 材料ID
+    
+    Returns:
+        Materialオブジェクト、存在しない場合はNone
+    """
+    return db.get(
+        Material,
+        material_id,
+        options=[
+            selectinload(Material.properties),
+            selectinload(Material.images),
+            selectinload(Material.metadata_items),
+            selectinload(Material.use_examples),
+        ],
+    )
@@ -5,149 +5,227 @@ Wikidata CC0データを基に、118元素すべてのJSONファイルを生成
 import json
 from pathlib import Path
 
+try:
+    import orjson
+
+    def _dumps_pretty(value) -> bytes:
+        """インデント2のJSONをUTF-8バイト列で返す（orjsonは日本語をエスケープしない）"""
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+    def _dumps_compact(value) -> bytes:
+        """空白なしのJSONをUTF-8バイト列で返す"""
+        return orjson.dumps(value, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    # orjsonが無い環境では標準ライブラリで代替
+    def _dumps_pretty(value) -> bytes:
+        """インデント2のJSONをUTF-8バイト列で返す"""
+        return (json.dumps(value, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+    def _dumps_compact(value) -> bytes:
+        """空白なしのJSONをUTF-8バイト列で返す"""
+        return (json.dumps(value, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _src(url: str) -> list:
+    """
+    Wikidata（CC0）の出典リストを作る
+    
+    Args:
+        url: WikidataのエンティティURL
+    
+    Returns:
+        sources フィールドに入れる出典リスト
+    """
+    return [{"name": "Wikidata", "license": "CC0", "url": url}]
+
+
 # 118元素すべての基本データ（Wikidata CC0、IUPAC標準に基づく）
 # 出典: Wikidata (CC0), IUPAC Periodic Table of Elements
-ELEMENTS_DATA = [
+# 1行1元素: (原子番号, 記号, 和名, 英名, 分類, 周期, 状態, WikidataエンティティID)
+_ELEMENT_ROWS = (
     # 周期1
-    {"atomic_number": 1, "symbol": "H", "name_ja": "水素", "name_en": "Hydrogen", "group": "非金属", "period": 1, "state": "気体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q556"}]},
-    {"atomic_number": 2, "symbol": "He", "name_ja": "ヘリウム", "name_en": "Helium", "group": "貴ガス", "period": 1, "state": "気体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q560"}]},
+    (1, "H", "水素", "Hydrogen", "非金属", 1, "気体", "Q556"),
+    (2, "He", "ヘリウム", "Helium", "貴ガス", 1, "気体", "Q560"),
     # 周期2
-    {"atomic_number": 3, "symbol": "Li", "name_ja": "リチウム", "name_en": "Lithium", "group": "アルカリ金属", "period": 2, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q568"}]},
-    {"atomic_number": 4, "symbol": "Be", "name_ja": "ベリリウム", "name_en": "Beryllium", "group": "アルカリ土類金属", "period": 2, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q569"}]},
-    {"atomic_number": 5, "symbol": "B", "name_ja": "ホウ素", "name_en": "Boron", "group": "半金属", "period": 2, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q570"}]},
-    {"atomic_number": 6, "symbol": "C", "name_ja": "炭素", "name_en": "Carbon", "group": "非金属", "period": 2, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q623"}]},
-    {"atomic_number": 7, "symbol": "N", "name_ja": "窒素", "name_en": "Nitrogen", "group": "非金属", "period": 2, "state": "気体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q627"}]},
-    {"atomic_number": 8, "symbol": "O", "name_ja": "酸素", "name_en": "Oxygen", "group": "非金属", "period": 2, "state": "気体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q629"}]},
-    {"atomic_number": 9, "symbol": "F", "name_ja": "フッ素", "name_en": "Fluorine", "group": "ハロゲン", "period": 2, "state": "気体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q568"}]},
-    {"atomic_number": 10, "symbol": "Ne", "name_ja": "ネオン", "name_en": "Neon", "group": "貴ガス", "period": 2, "state": "気体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q680"}]},
+    (3, "Li", "リチウム", "Lithium", "アルカリ金属", 2, "固体", "Q568"),
+    (4, "Be", "ベリリウム", "Beryllium", "アルカリ土類金属", 2, "固体", "Q569"),
+    (5, "B", "ホウ素", "Boron", "半金属", 2, "固体", "Q570"),
+    (6, "C", "炭素", "Carbon", "非金属", 2, "固体", "Q623"),
+    (7, "N", "窒素", "Nitrogen", "非金属", 2, "気体", "Q627"),
+    (8, "O", "酸素", "Oxygen", "非金属", 2, "気体", "Q629"),
+    (9, "F", "フッ素", "Fluorine", "ハロゲン", 2, "気体", "Q568"),
+    (10, "Ne", "ネオン", "Neon", "貴ガス", 2, "気体", "Q680"),
     # 周期3
-    {"atomic_number": 11, "symbol": "Na", "name_ja": "ナトリウム", "name_en": "Sodium", "group": "アルカリ金属", "period": 3, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q682"}]},
-    {"atomic_number": 12, "symbol": "Mg", "name_ja": "マグネシウム", "name_en": "Magnesium", "group": "アルカリ土類金属", "period": 3, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q660"}]},
-    {"atomic_number": 13, "symbol": "Al", "name_ja": "アルミニウム", "name_en": "Aluminum", "group": "金属", "period": 3, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q663"}]},
-    {"atomic_number": 14, "symbol": "Si", "name_ja": "ケイ素", "name_en": "Silicon", "group": "半金属", "period": 3, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q670"}]},
-    {"atomic_number": 15, "symbol": "P", "name_ja": "リン", "name_en": "Phosphorus", "group": "非金属", "period": 3, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q674"}]},
-    {"atomic_number": 16, "symbol": "S", "name_ja": "硫黄", "name_en": "Sulfur", "group": "非金属", "period": 3, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q682"}]},
-    {"atomic_number": 17, "symbol": "Cl", "name_ja": "塩素", "name_en": "Chlorine", "group": "ハロゲン", "period": 3, "state": "気体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q688"}]},
-    {"atomic_number": 18, "symbol": "Ar", "name_ja": "アルゴン", "name_en": "Argon", "group": "貴ガス", "period": 3, "state": "気体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q690"}]},
+    (11, "Na", "ナトリウム", "Sodium", "アルカリ金属", 3, "固体", "Q682"),
+    (12, "Mg", "マグネシウム", "Magnesium", "アルカリ土類金属", 3, "固体", "Q660"),
+    (13, "Al", "アルミニウム", "Aluminum", "金属", 3, "固体", "Q663"),
+    (14, "Si", "ケイ素", "Silicon", "半金属", 3, "固体", "Q670"),
+    (15, "P", "リン", "Phosphorus", "非金属", 3, "固体", "Q674"),
+    (16, "S", "硫黄", "Sulfur", "非金属", 3, "固体", "Q682"),
+    (17, "Cl", "塩素", "Chlorine", "ハロゲン", 3, "気体", "Q688"),
+    (18, "Ar", "アルゴン", "Argon", "貴ガス", 3, "気体", "Q690"),
     # 周期4
-    {"atomic_number": 19, "symbol": "K", "name_ja": "カリウム", "name_en": "Potassium", "group": "アルカリ金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q696"}]},
-    {"atomic_number": 20, "symbol": "Ca", "name_ja": "カルシウム", "name_en": "Calcium", "group": "アルカリ土類金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q698"}]},
-    {"atomic_number": 21, "symbol": "Sc", "name_ja": "スカンジウム", "name_en": "Scandium", "group": "遷移金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q700"}]},
-    {"atomic_number": 22, "symbol": "Ti", "name_ja": "チタン", "name_en": "Titanium", "group": "遷移金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q702"}]},
-    {"atomic_number": 23, "symbol": "V", "name_ja": "バナジウム", "name_en": "Vanadium", "group": "遷移金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q704"}]},
-    {"atomic_number": 24, "symbol": "Cr", "name_ja": "クロム", "name_en": "Chromium", "group": "遷移金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q706"}]},
-    {"atomic_number": 25, "symbol": "Mn", "name_ja": "マンガン", "name_en": "Manganese", "group": "遷移金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q708"}]},
-    {"atomic_number": 26, "symbol": "Fe", "name_ja": "鉄", "name_en": "Iron", "group": "遷移金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q709"}]},
-    {"atomic_number": 27, "symbol": "Co", "name_ja": "コバルト", "name_en": "Cobalt", "group": "遷移金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q710"}]},
-    {"atomic_number": 28, "symbol": "Ni", "name_ja": "ニッケル", "name_en": "Nickel", "group": "遷移金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q711"}]},
-    {"atomic_number": 29, "symbol": "Cu", "name_ja": "銅", "name_en": "Copper", "group": "遷移金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q753"}]},
-    {"atomic_number": 30, "symbol": "Zn", "name_ja": "亜鉛", "name_en": "Zinc", "group": "遷移金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q758"}]},
-    {"atomic_number": 31, "symbol": "Ga", "name_ja": "ガリウム", "name_en": "Gallium", "group": "金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q760"}]},
-    {"atomic_number": 32, "symbol": "Ge", "name_ja": "ゲルマニウム", "name_en": "Germanium", "group": "半金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q761"}]},
-    {"atomic_number": 33, "symbol": "As", "name_ja": "ヒ素", "name_en": "Arsenic", "group": "半金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q762"}]},
-    {"atomic_number": 34, "symbol": "Se", "name_ja": "セレン", "name_en": "Selenium", "group": "非金属", "period": 4, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q763"}]},
-    {"atomic_number": 35, "symbol": "Br", "name_ja": "臭素", "name_en": "Bromine", "group": "ハロゲン", "period": 4, "state": "液体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q764"}]},
-    {"atomic_number": 36, "symbol": "Kr", "name_ja": "クリプトン", "name_en": "Krypton", "group": "貴ガス", "period": 4, "state": "気体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q765"}]},
+    (19, "K", "カリウム", "Potassium", "アルカリ金属", 4, "固体", "Q696"),
+    (20, "Ca", "カルシウム", "Calcium", "アルカリ土類金属", 4, "固体", "Q698"),
+    (21, "Sc", "スカンジウム", "Scandium", "遷移金属", 4, "固体", "Q700"),
+    (22, "Ti", "チタン", "Titanium", "遷移金属", 4, "固体", "Q702"),
+    (23, "V", "バナジウム", "Vanadium", "遷移金属", 4, "固体", "Q704"),
+    (24, "Cr", "クロム", "Chromium", "遷移金属", 4, "固体", "Q706"),
+    (25, "Mn", "マンガン", "Manganese", "遷移金属", 4, "固体", "Q708"),
+    (26, "Fe", "鉄", "Iron", "遷移金属", 4, "固体", "Q709"),
+    (27, "Co", "コバルト", "Cobalt", "遷移金属", 4, "固体", "Q710"),
+    (28, "Ni", "ニッケル", "Nickel", "遷移金属", 4, "固体", "Q711"),
+    (29, "Cu", "銅", "Copper", "遷移金属", 4, "固体", "Q753"),
+    (30, "Zn", "亜鉛", "Zinc", "遷移金属", 4, "固体", "Q758"),
+    (31, "Ga", "ガリウム", "Gallium", "金属", 4, "固体", "Q760"),
+    (32, "Ge", "ゲルマニウム", "Germanium", "半金属", 4, "固体", "Q761"),
+    (33, "As", "ヒ素", "Arsenic", "半金属", 4, "固体", "Q762"),
+    (34, "Se", "セレン", "Selenium", "非金属", 4, "固体", "Q763"),
+    (35, "Br", "臭素", "Bromine", "ハロゲン", 4, "液体", "Q764"),
+    (36, "Kr", "クリプトン", "Krypton", "貴ガス", 4, "気体", "Q765"),
     # 周期5
-    {"atomic_number": 37, "symbol": "Rb", "name_ja": "ルビジウム", "name_en": "Rubidium", "group": "アルカリ金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q766"}]},
-    {"atomic_number": 38, "symbol": "Sr", "name_ja": "ストロンチウム", "name_en": "Strontium", "group": "アルカリ土類金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q768"}]},
-    {"atomic_number": 39, "symbol": "Y", "name_ja": "イットリウム", "name_en": "Yttrium", "group": "遷移金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q770"}]},
-    {"atomic_number": 40, "symbol": "Zr", "name_ja": "ジルコニウム", "name_en": "Zirconium", "group": "遷移金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q772"}]},
-    {"atomic_number": 41, "symbol": "Nb", "name_ja": "ニオブ", "name_en": "Niobium", "group": "遷移金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q774"}]},
-    {"atomic_number": 42, "symbol": "Mo", "name_ja": "モリブデン", "name_en": "Molybdenum", "group": "遷移金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q776"}]},
-    {"atomic_number": 43, "symbol": "Tc", "name_ja": "テクネチウム", "name_en": "Technetium", "group": "遷移金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q778"}]},
-    {"atomic_number": 44, "symbol": "Ru", "name_ja": "ルテニウム", "name_en": "Ruthenium", "group": "遷移金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q780"}]},
-    {"atomic_number": 45, "symbol": "Rh", "name_ja": "ロジウム", "name_en": "Rhodium", "group": "遷移金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q782"}]},
-    {"atomic_number": 46, "symbol": "Pd", "name_ja": "パラジウム", "name_en": "Palladium", "group": "遷移金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q784"}]},
-    {"atomic_number": 47, "symbol": "Ag", "name_ja": "銀", "name_en": "Silver", "group": "遷移金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q786"}]},
-    {"atomic_number": 48, "symbol": "Cd", "name_ja": "カドミウム", "name_en": "Cadmium", "group": "遷移金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q788"}]},
-    {"atomic_number": 49, "symbol": "In", "name_ja": "インジウム", "name_en": "Indium", "group": "金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q790"}]},
-    {"atomic_number": 50, "symbol": "Sn", "name_ja": "スズ", "name_en": "Tin", "group": "金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q792"}]},
-    {"atomic_number": 51, "symbol": "Sb", "name_ja": "アンチモン", "name_en": "Antimony", "group": "半金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q794"}]},
-    {"atomic_number": 52, "symbol": "Te", "name_ja": "テルル", "name_en": "Tellurium", "group": "半金属", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q796"}]},
-    {"atomic_number": 53, "symbol": "I", "name_ja": "ヨウ素", "name_en": "Iodine", "group": "ハロゲン", "period": 5, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q798"}]},
-    {"atomic_number": 54, "symbol": "Xe", "name_ja": "キセノン", "name_en": "Xenon", "group": "貴ガス", "period": 5, "state": "気体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q800"}]},
+    (37, "Rb", "ルビジウム", "Rubidium", "アルカリ金属", 5, "固体", "Q766"),
+    (38, "Sr", "ストロンチウム", "Strontium", "アルカリ土類金属", 5, "固体", "Q768"),
+    (39, "Y", "イットリウム", "Yttrium", "遷移金属", 5, "固体", "Q770"),
+    (40, "Zr", "ジルコニウム", "Zirconium", "遷移金属", 5, "固体", "Q772"),
+    (41, "Nb", "ニオブ", "Niobium", "遷移金属", 5, "固体", "Q774"),
+    (42, "Mo", "モリブデン", "Molybdenum", "遷移金属", 5, "固体", "Q776"),
+    (43, "Tc", "テクネチウム", "Technetium", "遷移金属", 5, "固体", "Q778"),
+    (44, "Ru", "ルテニウム", "Ruthenium", "遷移金属", 5, "固体", "Q780"),
+    (45, "Rh", "ロジウム", "Rhodium", "遷移金属", 5, "固体", "Q782"),
+    (46, "Pd", "パラジウム", "Palladium", "遷移金属", 5, "固体", "Q784"),
+    (47, "Ag", "銀", "Silver", "遷移金属", 5, "固体", "Q786"),
+    (48, "Cd", "カドミウム", "Cadmium", "遷移金属", 5, "固体", "Q788"),
+    (49, "In", "インジウム", "Indium", "金属", 5, "固体", "Q790"),
+    (50, "Sn", "スズ", "Tin", "金属", 5, "固体", "Q792"),
+    (51, "Sb", "アンチモン", "Antimony", "半金属", 5, "固体", "Q794"),
+    (52, "Te", "テルル", "Tellurium", "半金属", 5, "固体", "Q796"),
+    (53, "I", "ヨウ素", "Iodine", "ハロゲン", 5, "固体", "Q798"),
+    (54, "Xe", "キセノン", "Xenon", "貴ガス", 5, "気体", "Q800"),
     # 周期6
-    {"atomic_number": 55, "symbol": "Cs", "name_ja": "セシウム", "name_en": "Cesium", "group": "アルカリ金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q802"}]},
-    {"atomic_number": 56, "symbol": "Ba", "name_ja": "バリウム", "name_en": "Barium", "group": "アルカリ土類金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q804"}]},
-    {"atomic_number": 57, "symbol": "La", "name_ja": "ランタン", "name_en": "Lanthanum", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q806"}]},
-    {"atomic_number": 58, "symbol": "Ce", "name_ja": "セリウム", "name_en": "Cerium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q808"}]},
-    {"atomic_number": 59, "symbol": "Pr", "name_ja": "プラセオジム", "name_en": "Praseodymium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q810"}]},
-    {"atomic_number": 60, "symbol": "Nd", "name_ja": "ネオジム", "name_en": "Neodymium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q812"}]},
-    {"atomic_number": 61, "symbol": "Pm", "name_ja": "プロメチウム", "name_en": "Promethium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q814"}]},
-    {"atomic_number": 62, "symbol": "Sm", "name_ja": "サマリウム", "name_en": "Samarium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q816"}]},
-    {"atomic_number": 63, "symbol": "Eu", "name_ja": "ユーロピウム", "name_en": "Europium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q818"}]},
-    {"atomic_number": 64, "symbol": "Gd", "name_ja": "ガドリニウム", "name_en": "Gadolinium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q820"}]},
-    {"atomic_number": 65, "symbol": "Tb", "name_ja": "テルビウム", "name_en": "Terbium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q822"}]},
-    {"atomic_number": 66, "symbol": "Dy", "name_ja": "ジスプロシウム", "name_en": "Dysprosium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q824"}]},
-    {"atomic_number": 67, "symbol": "Ho", "name_ja": "ホルミウム", "name_en": "Holmium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q826"}]},
-    {"atomic_number": 68, "symbol": "Er", "name_ja": "エルビウム", "name_en": "Erbium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q828"}]},
-    {"atomic_number": 69, "symbol": "Tm", "name_ja": "ツリウム", "name_en": "Thulium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q830"}]},
-    {"atomic_number": 70, "symbol": "Yb", "name_ja": "イッテルビウム", "name_en": "Ytterbium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q832"}]},
-    {"atomic_number": 71, "symbol": "Lu", "name_ja": "ルテチウム", "name_en": "Lutetium", "group": "ランタノイド", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q834"}]},
-    {"atomic_number": 72, "symbol": "Hf", "name_ja": "ハフニウム", "name_en": "Hafnium", "group": "遷移金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q836"}]},
-    {"atomic_number": 73, "symbol": "Ta", "name_ja": "タンタル", "name_en": "Tantalum", "group": "遷移金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q838"}]},
-    {"atomic_number": 74, "symbol": "W", "name_ja": "タングステン", "name_en": "Tungsten", "group": "遷移金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q840"}]},
-    {"atomic_number": 75, "symbol": "Re", "name_ja": "レニウム", "name_en": "Rhenium", "group": "遷移金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q842"}]},
-    {"atomic_number": 76, "symbol": "Os", "name_ja": "オスミウム", "name_en": "Osmium", "group": "遷移金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q844"}]},
-    {"atomic_number": 77, "symbol": "Ir", "name_ja": "イリジウム", "name_en": "Iridium", "group": "遷移金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q846"}]},
-    {"atomic_number": 78, "symbol": "Pt", "name_ja": "白金", "name_en": "Platinum", "group": "遷移金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q848"}]},
-    {"atomic_number": 79, "symbol": "Au", "name_ja": "金", "name_en": "Gold", "group": "遷移金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q850"}]},
-    {"atomic_number": 80, "symbol": "Hg", "name_ja": "水銀", "name_en": "Mercury", "group": "遷移金属", "period": 6, "state": "液体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q852"}]},
-    {"atomic_number": 81, "symbol": "Tl", "name_ja": "タリウム", "name_en": "Thallium", "group": "金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q854"}]},
-    {"atomic_number": 82, "symbol": "Pb", "name_ja": "鉛", "name_en": "Lead", "group": "金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q856"}]},
-    {"atomic_number": 83, "symbol": "Bi", "name_ja": "ビスマス", "name_en": "Bismuth", "group": "金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q858"}]},
-    {"atomic_number": 84, "symbol": "Po", "name_ja": "ポロニウム", "name_en": "Polonium", "group": "半金属", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q860"}]},
-    {"atomic_number": 85, "symbol": "At", "name_ja": "アスタチン", "name_en": "Astatine", "group": "ハロゲン", "period": 6, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q862"}]},
-    {"atomic_number": 86, "symbol": "Rn", "name_ja": "ラドン", "name_en": "Radon", "group": "貴ガス", "period": 6, "state": "気体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q864"}]},
+    (55, "Cs", "セシウム", "Cesium", "アルカリ金属", 6, "固体", "Q802"),
+    (56, "Ba", "バリウム", "Barium", "アルカリ土類金属", 6, "固体", "Q804"),
+    (57, "La", "ランタン", "Lanthanum", "ランタノイド", 6, "固体", "Q806"),
+    (58, "Ce", "セリウム", "Cerium", "ランタノイド", 6, "固体", "Q808"),
+    (59, "Pr", "プラセオジム", "Praseodymium", "ランタノイド", 6, "固体", "Q810"),
+    (60, "Nd", "ネオジム", "Neodymium", "ランタノイド", 6, "固体", "Q812"),
+    (61, "Pm", "プロメチウム", "Promethium", "ランタノイド", 6, "固体", "Q814"),
+    (62, "Sm", "サマリウム", "Samarium", "ランタノイド", 6, "固体", "Q816"),
+    (63, "Eu", "ユーロピウム", "Europium", "ランタノイド", 6, "固体", "Q818"),
+    (64, "Gd", "ガドリニウム", "Gadolinium", "ランタノイド", 6, "固体", "Q820"),
+    (65, "Tb", "テルビウム", "Terbium", "ランタノイド", 6, "固体", "Q822"),
+    (66, "Dy", "ジスプロシウム", "Dysprosium", "ランタノイド", 6, "固体", "Q824"),
+    (67, "Ho", "ホルミウム", "Holmium", "ランタノイド", 6, "固体", "Q826"),
+    (68, "Er", "エルビウム", "Erbium", "ランタノイド", 6, "固体", "Q828"),
+    (69, "Tm", "ツリウム", "Thulium", "ランタノイド", 6, "固体", "Q830"),
+    (70, "Yb", "イッテルビウム", "Ytterbium", "ランタノイド", 6, "固体", "Q832"),
+    (71, "Lu", "ルテチウム", "Lutetium", "ランタノイド", 6, "固体", "Q834"),
+    (72, "Hf", "ハフニウム", "Hafnium", "遷移金属", 6, "固体", "Q836"),
+    (73, "Ta", "タンタル", "Tantalum", "遷移金属", 6, "固体", "Q838"),
+    (74, "W", "タングステン", "Tungsten", "遷移金属", 6, "固体", "Q840"),
+    (75, "Re", "レニウム", "Rhenium", "遷移金属", 6, "固体", "Q842"),
+    (76, "Os", "オスミウム", "Osmium", "遷移金属", 6, "固体", "Q844"),
+    (77, "Ir", "イリジウム", "Iridium", "遷移金属", 6, "固体", "Q846"),
+    (78, "Pt", "白金", "Platinum", "遷移金属", 6, "固体", "Q848"),
+    (79, "Au", "金", "Gold", "遷移金属", 6, "固体", "Q850"),
+    (80, "Hg", "水銀", "Mercury", "遷移金属", 6, "液体", "Q852"),
+    (81, "Tl", "タリウム", "Thallium", "金属", 6, "固体", "Q854"),
+    (82, "Pb", "鉛", "Lead", "金属", 6, "固体", "Q856"),
+    (83, "Bi", "ビスマス", "Bismuth", "金属", 6, "固体", "Q858"),
+    (84, "Po", "ポロニウム", "Polonium", "半金属", 6, "固体", "Q860"),
+    (85, "At", "アスタチン", "Astatine", "ハロゲン", 6, "固体", "Q862"),
+    (86, "Rn", "ラドン", "Radon", "貴ガス", 6, "気体", "Q864"),
     # 周期7
-    {"atomic_number": 87, "symbol": "Fr", "name_ja": "フランシウム", "name_en": "Francium", "group": "アルカリ金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q866"}]},
-    {"atomic_number": 88, "symbol": "Ra", "name_ja": "ラジウム", "name_en": "Radium", "group": "アルカリ土類金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q868"}]},
-    {"atomic_number": 89, "symbol": "Ac", "name_ja": "アクチニウム", "name_en": "Actinium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q870"}]},
-    {"atomic_number": 90, "symbol": "Th", "name_ja": "トリウム", "name_en": "Thorium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q872"}]},
-    {"atomic_number": 91, "symbol": "Pa", "name_ja": "プロトアクチニウム", "name_en": "Protactinium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q874"}]},
-    {"atomic_number": 92, "symbol": "U", "name_ja": "ウラン", "name_en": "Uranium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q876"}]},
-    {"atomic_number": 93, "symbol": "Np", "name_ja": "ネプツニウム", "name_en": "Neptunium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q878"}]},
-    {"atomic_number": 94, "symbol": "Pu", "name_ja": "プルトニウム", "name_en": "Plutonium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q880"}]},
-    {"atomic_number": 95, "symbol": "Am", "name_ja": "アメリシウム", "name_en": "Americium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q882"}]},
-    {"atomic_number": 96, "symbol": "Cm", "name_ja": "キュリウム", "name_en": "Curium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q884"}]},
-    {"atomic_number": 97, "symbol": "Bk", "name_ja": "バークリウム", "name_en": "Berkelium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q886"}]},
-    {"atomic_number": 98, "symbol": "Cf", "name_ja": "カリホルニウム", "name_en": "Californium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q888"}]},
-    {"atomic_number": 99, "symbol": "Es", "name_ja": "アインスタイニウム", "name_en": "Einsteinium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q890"}]},
-    {"atomic_number": 100, "symbol": "Fm", "name_ja": "フェルミウム", "name_en": "Fermium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q892"}]},
-    {"atomic_number": 101, "symbol": "Md", "name_ja": "メンデレビウム", "name_en": "Mendelevium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q894"}]},
-    {"atomic_number": 102, "symbol": "No", "name_ja": "ノーベリウム", "name_en": "Nobelium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q896"}]},
-    {"atomic_number": 103, "symbol": "Lr", "name_ja": "ローレンシウム", "name_en": "Lawrencium", "group": "アクチノイド", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q898"}]},
-    {"atomic_number": 104, "symbol": "Rf", "name_ja": "ラザホージウム", "name_en": "Rutherfordium", "group": "遷移金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q900"}]},
-    {"atomic_number": 105, "symbol": "Db", "name_ja": "ドブニウム", "name_en": "Dubnium", "group": "遷移金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q902"}]},
-    {"atomic_number": 106, "symbol": "Sg", "name_ja": "シーボーギウム", "name_en": "Seaborgium", "group": "遷移金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q904"}]},
-    {"atomic_number": 107, "symbol": "Bh", "name_ja": "ボーリウム", "name_en": "Bohrium", "group": "遷移金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q906"}]},
-    {"atomic_number": 108, "symbol": "Hs", "name_ja": "ハッシウム", "name_en": "Hassium", "group": "遷移金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q908"}]},
-    {"atomic_number": 109, "symbol": "Mt", "name_ja": "マイトネリウム", "name_en": "Meitnerium", "group": "遷移金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q910"}]},
-    {"atomic_number": 110, "symbol": "Ds", "name_ja": "ダームスタチウム", "name_en": "Darmstadtium", "group": "遷移金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q912"}]},
-    {"atomic_number": 111, "symbol": "Rg", "name_ja": "レントゲニウム", "name_en": "Roentgenium", "group": "遷移金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q914"}]},
-    {"atomic_number": 112, "symbol": "Cn", "name_ja": "コペルニシウム", "name_en": "Copernicium", "group": "遷移金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q916"}]},
-    {"atomic_number": 113, "symbol": "Nh", "name_ja": "ニホニウム", "name_en": "Nihonium", "group": "金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q918"}]},
-    {"atomic_number": 114, "symbol": "Fl", "name_ja": "フレロビウム", "name_en": "Flerovium", "group": "金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q920"}]},
-    {"atomic_number": 115, "symbol": "Mc", "name_ja": "モスコビウム", "name_en": "Moscovium", "group": "金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q922"}]},
-    {"atomic_number": 116, "symbol": "Lv", "name_ja": "リバモリウム", "name_en": "Livermorium", "group": "金属", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q924"}]},
-    {"atomic_number": 117, "symbol": "Ts", "name_ja": "テネシン", "name_en": "Tennessine", "group": "ハロゲン", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q926"}]},
-    {"atomic_number": 118, "symbol": "Og", "name_ja": "オガネソン", "name_en": "Oganesson", "group": "貴ガス", "period": 7, "state": "固体", "notes": "", "sources": [{"name": "Wikidata", "license": "CC0", "url": "https://www.wikidata.org/wiki/Q928"}]}
-]
-
-def generate_elements_json():
-    """元素データJSONファイルを生成"""
+    (87, "Fr", "フランシウム", "Francium", "アルカリ金属", 7, "固体", "Q866"),
+    (88, "Ra", "ラジウム", "Radium", "アルカリ土類金属", 7, "固体", "Q868"),
+    (89, "Ac", "アクチニウム", "Actinium", "アクチノイド", 7, "固体", "Q870"),
+    (90, "Th", "トリウム", "Thorium", "アクチノイド", 7, "固体", "Q872"),
+    (91, "Pa", "プロトアクチニウム", "Protactinium", "アクチノイド", 7, "固体", "Q874"),
+    (92, "U", "ウラン", "Uranium", "アクチノイド", 7, "固体", "Q876"),
+    (93, "Np", "ネプツニウム", "Neptunium", "アクチノイド", 7, "固体", "Q878"),
+    (94, "Pu", "プルトニウム", "Plutonium", "アクチノイド", 7, "固体", "Q880"),
+    (95, "Am", "アメリシウム", "Americium", "アクチノイド", 7, "固体", "Q882"),
+    (96, "Cm", "キュリウム", "Curium", "アクチノイド", 7, "固体", "Q884"),
+    (97, "Bk", "バークリウム", "Berkelium", "アクチノイド", 7, "固体", "Q886"),
+    (98, "Cf", "カリホルニウム", "Californium", "アクチノイド", 7, "固体", "Q888"),
+    (99, "Es", "アインスタイニウム", "Einsteinium", "アクチノイド", 7, "固体", "Q890"),
+    (100, "Fm", "フェルミウム", "Fermium", "アクチノイド", 7, "固体", "Q892"),
+    (101, "Md", "メンデレビウム", "Mendelevium", "アクチノイド", 7, "固体", "Q894"),
+    (102, "No", "ノーベリウム", "Nobelium", "アクチノイド", 7, "固体", "Q896"),
+    (103, "Lr", "ローレンシウム", "Lawrencium", "アクチノイド", 7, "固体", "Q898"),
+    (104, "Rf", "ラザホージウム", "Rutherfordium", "遷移金属", 7, "固体", "Q900"),
+    (105, "Db", "ドブニウム", "Dubnium", "遷移金属", 7, "固体", "Q902"),
+    (106, "Sg", "シーボーギウム", "Seaborgium", "遷移金属", 7, "固体", "Q904"),
+    (107, "Bh", "ボーリウム", "Bohrium", "遷移金属", 7, "固体", "Q906"),
+    (108, "Hs", "ハッシウム", "Hassium", "遷移金属", 7, "固体", "Q908"),
+    (109, "Mt", "マイトネリウム", "Meitnerium", "遷移金属", 7, "固体", "Q910"),
+    (110, "Ds", "ダームスタチウム", "Darmstadtium", "遷移金属", 7, "固体", "Q912"),
+    (111, "Rg", "レントゲニウム", "Roentgenium", "遷移金属", 7, "固体", "Q914"),
+    (112, "Cn", "コペルニシウム", "Copernicium", "遷移金属", 7, "固体", "Q916"),
+    (113, "Nh", "ニホニウム", "Nihonium", "金属", 7, "固体", "Q918"),
+    (114, "Fl", "フレロビウム", "Flerovium", "金属", 7, "固体", "Q920"),
+    (115, "Mc", "モスコビウム", "Moscovium", "金属", 7, "固体", "Q922"),
+    (116, "Lv", "リバモリウム", "Livermorium", "金属", 7, "固体", "Q924"),
+    (117, "Ts", "テネシン", "Tennessine", "ハロゲン", 7, "固体", "Q926"),
+    (118, "Og", "オガネソン", "Oganesson", "貴ガス", 7, "固体", "Q928"),
+)
+
+
+def build_elements_data() -> list:
+    """
+    元素テーブルから elements.json に書き出す辞書のリストを組み立てる
+    
+    Returns:
+        元素データ辞書のリスト（原子番号順）
+    """
+    return [
+        {
+            "atomic_number": atomic_number,
+            "symbol": symbol,
+            "name_ja": name_ja,
+            "name_en": name_en,
+            "group": group,
+            "period": period,
+            "state": state,
+            "notes": "",
+            "sources": _src(f"https://www.wikidata.org/wiki/{wikidata_id}"),
+        }
+        for atomic_number, symbol, name_ja, name_en, group, period, state, wikidata_id in _ELEMENT_ROWS
+    ]
+
+
+def generate_elements_json(pretty: bool = True):
+    """
+    元素データJSONファイルを生成
+    
+    Args:
+        pretty: Trueならインデント2で出力（Git管理用）、Falseなら空白なしで出力
+    """
     output_path = Path("data/elements.json")
     output_path.parent.mkdir(exist_ok=True)
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(ELEMENTS_DATA, f, ensure_ascii=False, indent=2)
+    elements_data = build_elements_data()
+    dumps = _dumps_pretty if pretty else _dumps_compact
+    payload = dumps(elements_data)
+    
+    # 内容が同じなら書き込まない（mtimeを変えず、差分も出さない）
+    if output_path.exists() and output_path.read_bytes() == payload:
+        print(f"✅ 元素データJSONファイルは最新です: {output_path}")
+        return
+    
+    output_path.write_bytes(payload)
     
     print(f"✅ 元素データJSONファイルを生成しました: {output_path}")
-    print(f"   総元素数: {len(ELEMENTS_DATA)}")
+    print(f"   総元素数: {len(elements_data)}")
 
 if __name__ == "__main__":
-    generate_elements_json()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="元素データJSONファイルを生成")
+    parser.add_argument("--compact", action="store_true", help="インデントなしで出力（配布用）")
+    args = parser.parse_args()
+    
+    generate_elements_json(pretty=not args.compact)
 
 
 
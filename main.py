@@ -5,13 +5,14 @@ from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, Query
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+from jinja2 import Environment
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Optional
 import os
 import shutil
 from pathlib import Path
 
-from database import get_db, init_db, Material, Property, Image, MaterialMetadata
+from database import get_db, get_db_write, get_material_full, init_db, write_material_bundle, Material, Image
 from schemas import (
     MaterialCreate, MaterialUpdate, Material as MaterialModel,
     PropertyCreate, Property, Image as ImageModel, Metadata as MetadataModel,
@@ -68,6 +69,13 @@ async def read_root():
     """
 
 
+# MaterialModel のレスポンスで参照する子テーブル
+_MATERIAL_RESPONSE_LOADS = (
+    selectinload(Material.properties),
+    selectinload(Material.images),
+)
+
+
 @app.get("/api/materials", response_model=List[MaterialModel])
 async def get_materials(
     skip: int = 0,
@@ -77,7 +85,8 @@ async def get_materials(
     db: Session = Depends(get_db)
 ):
     """材料一覧取得"""
-    query = db.query(Material)
+    # レスポンスに含める子テーブルは IN クエリでまとめて読む（材料ごとのSELECTを避ける）
+    query = db.query(Material).options(*_MATERIAL_RESPONSE_LOADS)
     
     if category:
         query = query.filter(Material.category == category)
@@ -92,53 +101,40 @@ async def get_materials(
 @app.get("/api/materials/{material_id}", response_model=MaterialModel)
 async def get_material(material_id: int, db: Session = Depends(get_db)):
     """材料詳細取得"""
-    material = db.query(Material).filter(Material.id == material_id).first()
+    material = db.query(Material).options(*_MATERIAL_RESPONSE_LOADS).filter(Material.id == material_id).first()
     if not material:
         raise HTTPException(status_code=404, detail="Material not found")
     return material
 
 
 @app.post("/api/materials", response_model=MaterialModel)
-async def create_material(material: MaterialCreate, db: Session = Depends(get_db)):
+def create_material(material: MaterialCreate, db: Session = Depends(get_db_write)):
     """材料作成"""
-    db_material = Material(
-        name=material.name,
-        category=material.category,
-        description=material.description
+    # 材料1文＋子テーブルごとに複数行1文で書き込む（行ごとのINSERTを避ける）
+    material_id = write_material_bundle(
+        db,
+        {"name": material.name, "category": material.category, "description": material.description},
+        [
+            {
+                "property_name": prop.property_name,
+                "value": prop.value,
+                "unit": prop.unit,
+                "measurement_condition": prop.measurement_condition,
+            }
+            for prop in material.properties
+        ],
+        [{"key": meta.key, "value": meta.value} for meta in material.metadata],
     )
-    db.add(db_material)
-    db.flush()
-    
-    # 物性データの追加
-    for prop in material.properties:
-        db_property = Property(
-            material_id=db_material.id,
-            property_name=prop.property_name,
-            value=prop.value,
-            unit=prop.unit,
-            measurement_condition=prop.measurement_condition
-        )
-        db.add(db_property)
-    
-    # メタデータの追加
-    for meta in material.metadata:
-        db_metadata = MaterialMetadata(
-            material_id=db_material.id,
-            key=meta.key,
-            value=meta.value
-        )
-        db.add(db_metadata)
-    
     db.commit()
-    db.refresh(db_material)
-    return db_material
+    
+    return db.query(Material).options(*_MATERIAL_RESPONSE_LOADS).filter(Material.id == material_id).first()
 
 
 @app.put("/api/materials/{material_id}", response_model=MaterialModel)
-async def update_material(
+def update_material(
     material_id: int,
     material_update: MaterialUpdate,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db_write)
 ):
     """材料更新"""
     db_material = db.query(Material).filter(Material.id == material_id).first()
@@ -155,7 +151,7 @@ async def update_material(
 
 
 @app.delete("/api/materials/{material_id}")
-async def delete_material(material_id: int, db: Session = Depends(get_db)):
+def delete_material(material_id: int, db: Session = Depends(get_db_write)):
     """材料削除"""
     db_material = db.query(Material).filter(Material.id == material_id).first()
     if not db_material:
@@ -167,12 +163,12 @@ async def delete_material(material_id: int, db: Session = Depends(get_db)):
 
 
 @app.post("/api/materials/{material_id}/images", response_model=ImageModel)
-async def upload_image(
+def upload_image(
     material_id: int,
     file: UploadFile = File(...),
     image_type: Optional[str] = None,
     description: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db_write)
 ):
     """画像アップロード"""
     material = db.query(Material).filter(Material.id == material_id).first()
@@ -200,10 +196,26 @@ async def upload_image(
     return db_image
 
 
+# カード生成失敗時のフォールバック（起動時に1回だけコンパイル、ユーザー入力はautoescape）
+_FALLBACK_CARD_TPL = Environment(autoescape=True).from_string("""
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Material Card - {{ name }}</title>
+</head>
+<body>
+    <h1>{{ name }}</h1>
+    <p>ID: {{ material_id }}</p>
+    <p>{{ desc }}</p>
+</body>
+</html>
+""")
+
+
 @app.get("/api/materials/{material_id}/card")
 async def get_material_card(material_id: int, db: Session = Depends(get_db)):
     """素材カード生成（HTML形式）"""
-    material = db.query(Material).filter(Material.id == material_id).first()
+    material = get_material_full(db, material_id)
     if not material:
         raise HTTPException(status_code=404, detail="Material not found")
     
@@ -250,26 +262,17 @@ async def get_material_card(material_id: int, db: Session = Depends(get_db)):
         )
         
         card_data = MaterialCard(payload=card_payload)
-        card_html = generate_material_card(card_data)
+        # /static をマウントしているので画像はURL参照（data URLに埋め込まない）
+        card_html = generate_material_card(card_data, inline_assets=False)
     except Exception as e:
         # フォールバック：最低限の情報だけのカード
         import traceback
         traceback.print_exc()
-        material_name = material.name or getattr(material, 'name_official', None) or 'Unknown'
-        material_desc = material.description or 'No description'
-        card_html = f"""
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>Material Card - {material_name}</title>
-        </head>
-        <body>
-            <h1>{material_name}</h1>
-            <p>ID: {material.id}</p>
-            <p>{material_desc}</p>
-        </body>
-        </html>
-        """
+        card_html = _FALLBACK_CARD_TPL.render(
+            name=material.name or getattr(material, 'name_official', None) or 'Unknown',
+            material_id=material.id,
+            desc=material.description or 'No description',
+        )
     
     return HTMLResponse(content=card_html)
 
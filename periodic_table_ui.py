@@ -8,6 +8,12 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from image_generator import ensure_element_image
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # 周期表のレイアウト定義
 # 構造: {周期: {族: 原子番号}}
 PERIODIC_TABLE_LAYOUT = {
@@ -37,8 +43,8 @@ def load_elements_data() -> Dict[int, Dict]:
         return {}
     
     try:
-        with open(elements_file, "r", encoding="utf-8") as f:
-            elements_list = json.load(f)
+        # バイト列のまま1回で読み込みデコードする（テキストI/Oを経由しない）
+        elements_list = _json_loads(elements_file.read_bytes())
         
         # 原子番号をキーとする辞書に変換
         elements_dict = {elem["atomic_number"]: elem for elem in elements_list}
@@ -1,7 +1,7 @@
 """
 Pydanticモデル（APIリクエスト/レスポンス用）
 """
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Optional, List, Any
 from datetime import datetime
 
@@ -100,6 +100,10 @@ class PropertyDTO(BaseModel):
         from_attributes = True
 
 
+# 物性DTOリストの一括検証用（バリデータを1回だけ構築して使い回す）
+PropertyDTOList = TypeAdapter(List[PropertyDTO])
+
+
 class MaterialCardPayload(BaseModel):
     """素材カード用のDTO（表示用データクラス）"""
     id: int
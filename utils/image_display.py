@@ -3,6 +3,7 @@
 すべての画像表示をこのモジュール経由で行う
 safe_slug基準で統一、IMAGE_BASE_URL対応、差し替え運用対応
 """
+import mmap
 import os
 import streamlit as st
 from pathlib import Path
@@ -10,8 +11,16 @@ from PIL import Image as PILImage
 from typing import Optional, Tuple, Union, Dict, Literal
 import re
 import base64
+from functools import lru_cache
 from io import BytesIO
 
+try:
+    # SIMD対応のBase64エンコーダ（data URL化を高速化。app.py もここから import する）
+    from pybase64 import b64encode
+except ImportError:
+    # pybase64が無い環境では標準ライブラリで代替
+    from base64 import b64encode
+
 try:
     from material_map_version import APP_VERSION
 except ImportError:
@@ -325,26 +334,70 @@ def to_data_url(image_path: Path) -> Optional[str]:
             return None
         
         with open(image_path, 'rb') as f:
-            img_data = f.read()
-        
-        # 拡張子からMIMEタイプを判定
-        ext = image_path.suffix.lower()
-        mime_types = {
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.webp': 'image/webp',
-            '.gif': 'image/gif',
-        }
-        mime_type = mime_types.get(ext, 'image/jpeg')
-        
-        # base64エンコード
-        base64_data = base64.b64encode(img_data).decode('utf-8')
-        return f"data:{mime_type};base64,{base64_data}"
+            try:
+                # ページキャッシュをそのままエンコーダに渡す（read()でのbytesコピーを作らない）
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return bytes_to_data_url(mapped, image_path.suffix)
+            except ValueError:
+                # 空ファイルはmmapできない
+                return bytes_to_data_url(f.read(), image_path.suffix)
     except Exception:
         return None
 
 
+# 拡張子 → MIMEタイプ（不明な拡張子はJPEG扱い）
+_DATA_URL_MIME_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.webp': 'image/webp',
+    '.gif': 'image/gif',
+}
+
+
+def bytes_to_data_url(img_data: bytes, suffix: str) -> str:
+    """
+    読み込み済みの画像バイト列をdata URLに変換
+    
+    Args:
+        img_data: 画像ファイルの中身（bytes や mmap などのバッファ）
+        suffix: 元ファイルの拡張子（例: ".png"、MIMEタイプの判定に使用）
+    
+    Returns:
+        data URL文字列
+    """
+    mime_type = _DATA_URL_MIME_TYPES.get(suffix.lower(), 'image/jpeg')
+    
+    # base64エンコード
+    base64_data = b64encode(img_data).decode('utf-8')
+    return f"data:{mime_type};base64,{base64_data}"
+
+
+@lru_cache(maxsize=64)
+def _to_data_url_cached(path_str: str, mtime_ns: int, size: int) -> Optional[str]:
+    """to_data_url のキャッシュ本体（mtime・サイズをキーに含め、差し替え時は自動で再エンコード）"""
+    return to_data_url(Path(path_str))
+
+
+def to_data_url_fast(image_path: Path) -> Optional[str]:
+    """
+    画像ファイルをdata URLに変換（変更されていないファイルはキャッシュを再利用）
+    
+    同じ素材のカードを繰り返し描画するときに、読み込みとBase64エンコードを省略する。
+    
+    Args:
+        image_path: 画像ファイルのパス
+    
+    Returns:
+        data URL文字列、またはNone
+    """
+    try:
+        st_result = os.stat(image_path)
+    except OSError:
+        return None
+    return _to_data_url_cached(str(image_path), st_result.st_mtime_ns, st_result.st_size)
+
+
 def to_png_bytes(image_source: Optional[Union[str, Path, PILImage.Image]], max_size: Optional[Tuple[int, int]] = None) -> Optional[bytes]:
     """
     画像ソースをPNG bytesに変換
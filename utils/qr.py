@@ -2,11 +2,33 @@
 QRコード生成ユーティリティ（Streamlit対応版）
 """
 import qrcode
+import threading
+from functools import lru_cache
 from io import BytesIO
 from PIL import Image as PILImage
 from typing import Optional
 
 
+# PNG書き出し用のバッファ（スレッドごとに1つを使い回す）
+_tls = threading.local()
+
+
+def _get_png_buffer() -> BytesIO:
+    """
+    スレッドローカルのBytesIOを空にして返す
+    
+    毎回BytesIOを確保・拡張・解放せず、同じバッファを使い回す。
+    getvalue()はコピーを返すので、戻り値のbytesはバッファ再利用の影響を受けない。
+    """
+    buffer = getattr(_tls, 'buffer', None)
+    if buffer is None:
+        buffer = _tls.buffer = BytesIO()
+    else:
+        buffer.seek(0)
+        buffer.truncate()
+    return buffer
+
+
 def generate_qr_png_bytes(data: str, box_size: int = 10, border: int = 5) -> Optional[bytes]:
     """
     QRコードをPNG形式のbytesとして生成（Streamlit対応）
@@ -42,10 +64,9 @@ def generate_qr_png_bytes(data: str, box_size: int = 10, border: int = 5) -> Opt
         if pil_img.mode != 'RGB':
             pil_img = pil_img.convert('RGB')
         
-        # PNG形式でBytesIOに保存
-        buffer = BytesIO()
+        # PNG形式でBytesIOに保存（スレッドローカルのバッファを再利用）
+        buffer = _get_png_buffer()
         pil_img.save(buffer, format='PNG')
-        buffer.seek(0)
         
         return buffer.getvalue()
     except Exception as e:
@@ -55,6 +76,39 @@ def generate_qr_png_bytes(data: str, box_size: int = 10, border: int = 5) -> Opt
         return None
 
 
+@lru_cache(maxsize=1024)
+def _material_qr_png_bytes_cached(material_id: int) -> bytes:
+    """
+    generate_material_qr_png_bytes のキャッシュ本体
+    
+    生成失敗（None）をキャッシュに残さないよう、失敗時は例外で抜ける。
+    """
+    png_bytes = generate_qr_png_bytes(f"Material ID: {material_id}")
+    if png_bytes is None:
+        raise RuntimeError(f"QRコードを生成できませんでした: material_id={material_id}")
+    return png_bytes
+
+
+def generate_material_qr_png_bytes(material_id: int) -> Optional[bytes]:
+    """
+    材料IDのQRコードPNG bytesを取得（material_idごとにキャッシュ）
+    
+    QRの内容は material_id だけで決まるため、同じ材料の再表示では再生成しない。
+    生成に失敗した場合はキャッシュせず、次回の呼び出しで再試行する。
+    
+    Args:
+        material_id: 材料ID
+    
+    Returns:
+        PNG形式のbytes、生成失敗時はNone
+    """
+    try:
+        return _material_qr_png_bytes_cached(material_id)
+    except RuntimeError:
+        # 失敗内容は generate_qr_png_bytes で出力済み
+        return None
+
+
 def generate_qr_pil_image(data: str, box_size: int = 10, border: int = 5) -> Optional[PILImage.Image]:
     """
     QRコードをPIL Imageオブジェクトとして生成